@@ -1,4 +1,7 @@
-import os
+import array
+import collections
+import itertools
+import sys
 #*--------------------------------------------------------------------
 #* La clase Director orquesta la construcción del objeto indicando 
 #* el orden en que deben llamarse sus componentes, los mismos son
@@ -12,6 +15,14 @@ class Director:
       self.__builder = builder
 	   
    def getAvion(self):
+      # Un builder que sabe entregar el avión ya armado lo hace con
+      # estamparAvion(); si no lo define o devuelve None se arma por pasos
+      estamparAvion = getattr(self.__builder, "estamparAvion", None)
+      if estamparAvion is not None:
+         avion = estamparAvion()
+         if avion is not None:
+            return avion
+
       avion = Avion()
       
       # Primero el body
@@ -39,17 +50,97 @@ class Director:
       # Retorna el vehiculo completo
       return avion
 
+   #*----------------------------------------------------------------
+   #* Construye una flota de aviones idénticos en una sola llamada.
+   #* El builder se recorre y se valida una única vez; las partes
+   #* resultantes se internan como flyweights inmutables y todos los
+   #* aviones de la flota las comparten. La tabla de internado es
+   #* propia de cada llamada, así que flotas distintas no comparten
+   #* partes
+   #*----------------------------------------------------------------
+   def getFlota(self, cantidad):
+      plantilla = self.getAvion()
+      if not plantilla.esCompleto():
+         raise ValueError("El builder no produce un avión completo")
+
+      tabla = {}
+      body = internarParte(plantilla.getBody(), tabla)
+      turbinas = [internarParte(turbina, tabla) for turbina in plantilla.getTurbinas()]
+      alas = [internarParte(ala, tabla) for ala in plantilla.getAlas()]
+      tren_aterrizaje = internarParte(plantilla.getTren(), tabla)
+
+      return [Avion.desdePartes(body, turbinas, alas, tren_aterrizaje)
+              for _ in range(cantidad)]
+
+   #*----------------------------------------------------------------
+   #* Línea de ensamblaje: arma un avión por cada builder de la lista
+   #* (pueden mezclarse subclases distintas de Builder). Cada pedido de
+   #* parte se ejecuta como una tarea independiente en un pool de hilos
+   #* o de procesos y los aviones se devuelven en el orden de la lista.
+   #* Conviene cuando los builders hacen trabajo real (E/S, simulación);
+   #* con procesos, los builders y sus partes deben poder serializarse
+   #*----------------------------------------------------------------
+   def getAvionesEnLinea(self, builders, trabajadores=4, procesos=False):
+      # Import diferido: importar el módulo no paga el costo del pool
+      from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+      builders = list(builders)
+      if procesos:
+         executor = ProcessPoolExecutor(max_workers=trabajadores)
+      else:
+         executor = ThreadPoolExecutor(max_workers=trabajadores)
+      with executor:
+         pedidos = [[executor.submit(_pedirParte, builder, metodo) for metodo in PASOS_AVION]
+                    for builder in builders]
+         aviones = []
+         for futuros in pedidos:
+            body, turbina_1, turbina_2, ala_1, ala_2, tren = [f.result() for f in futuros]
+            aviones.append(Avion.desdePartes(body, [turbina_1, turbina_2],
+                                             [ala_1, ala_2], tren))
+      return aviones
+
+   #*----------------------------------------------------------------
+   #* Igual que getFlota() pero devuelve la flota en columnas
+   #*----------------------------------------------------------------
+   def getFlotaColumnar(self, cantidad):
+      plantilla = self.getAvion()
+      if not plantilla.esCompleto():
+         raise ValueError("El builder no produce un avión completo")
+      flota = FlotaColumnar()
+      flota.attachAviones(plantilla, cantidad)
+      return flota
+
+#*----------------------------------------------------------------
+#* Pedidos de partes que hace el Director para armar un avión, en el
+#* mismo orden que getAvion()
+#*----------------------------------------------------------------
+PASOS_AVION = ("getBody", "getTurbina", "getTurbina", "getAla", "getAla", "getTren")
+
+def _pedirParte(builder, metodo):
+   return getattr(builder, metodo)()
+
 #*----------------------------------------------------------------
 #* Esta es la definición de un objeto vehiculo inicializando 
 #* todos sus atributos
 #*----------------------------------------------------------------
 class Avion:
+   __slots__ = ("__body", "__turbinas", "__alas", "__tren_aterrizaje")
+
    def __init__(self):
       self.__body = None
       self.__turbinas = list()
       self.__alas = list()
       self.__tren_aterrizaje = None
 
+   @classmethod
+   def desdePartes(cls, body, turbinas, alas, tren_aterrizaje):
+      avion = cls.__new__(cls)
+      avion.__body = body
+      avion.__turbinas = list(turbinas)
+      avion.__alas = list(alas)
+      avion.__tren_aterrizaje = tren_aterrizaje
+      return avion
+
    def setBody(self, body):
       self.__body = body
       
@@ -62,6 +153,28 @@ class Avion:
    def setTren(self, tren_aterrizaje):
       self.__tren_aterrizaje = tren_aterrizaje
 
+   def getBody(self):
+      return self.__body
+
+   def getTurbinas(self):
+      return self.__turbinas
+
+   def getAlas(self):
+      return self.__alas
+
+   def getTren(self):
+      return self.__tren_aterrizaje
+
+   # Verifica que el avión tenga todas sus partes y que estén inicializadas
+   def esCompleto(self):
+      return (self.__body is not None and self.__body.material is not None
+              and len(self.__turbinas) == 2
+              and all(t.potencia is not None for t in self.__turbinas)
+              and len(self.__alas) == 2
+              and all(a.size is not None for a in self.__alas)
+              and self.__tren_aterrizaje is not None
+              and self.__tren_aterrizaje.resistencia is not None)
+
    def specification(self):
       print ("body: %s" % (self.__body.material))
       print ("turbinas: %d\'" % (self.__turbinas[0].potencia))
@@ -80,6 +193,8 @@ class Builder:
       def getTurbina(self): pass
       def getAla(self): pass
       def getTren(self): pass
+      # Opcional: devolver el avión completo de una vez (None = armar por pasos)
+      def estamparAvion(self): return None
 #*-----------------------------------------------------------------
 #* Esta es la hoja de ruta para construir un Avión
 #* Establece instancias para tomar body, turbinas, alas y el tren de aterrizaje
@@ -107,20 +222,228 @@ class AvionBuilder(Builder):
       return tren_aterrizaje
    
 
+#*-----------------------------------------------------------------
+#* Builder con plantilla: envuelve a otro builder, registra el avión
+#* completo que produce la primera vez y a partir de ahí entrega
+#* copias estructurales de esas partes. La plantilla se descarta si
+#* cambia la configuración (los atributos) del builder envuelto o si
+#* se llama a invalidar()
+#*-----------------------------------------------------------------
+class BuilderPlantilla(Builder):
+   def __init__(self, builder):
+      self.builder = builder
+      self.invalidar()
+
+   def invalidar(self):
+      self.__plantilla = None
+      self.__configuracion = None
+      self.__turbina = 0
+      self.__ala = 0
+
+   def __getPlantilla(self):
+      configuracion = getattr(self.builder, "__dict__", None)
+      if self.__plantilla is None or configuracion != self.__configuracion:
+         director = Director()
+         director.setBuilder(self.builder)
+         self.__plantilla = director.getAvion()
+         self.__configuracion = dict(configuracion) if configuracion is not None else None
+      return self.__plantilla
+
+   def estamparAvion(self):
+      plantilla = self.__getPlantilla()
+      return Avion.desdePartes(plantilla.getBody().copiar(),
+                               [t.copiar() for t in plantilla.getTurbinas()],
+                               [a.copiar() for a in plantilla.getAlas()],
+                               plantilla.getTren().copiar())
+
+   def getBody(self):
+      return self.__getPlantilla().getBody().copiar()
+
+   # Turbinas y alas se entregan alternando entre las dos de la plantilla
+   def getTurbina(self):
+      turbinas = self.__getPlantilla().getTurbinas()
+      self.__turbina = (self.__turbina + 1) % len(turbinas)
+      return turbinas[self.__turbina - 1].copiar()
+
+   def getAla(self):
+      alas = self.__getPlantilla().getAlas()
+      self.__ala = (self.__ala + 1) % len(alas)
+      return alas[self.__ala - 1].copiar()
+
+   def getTren(self):
+      return self.__getPlantilla().getTren().copiar()
+
 #*----------------------------------------------------------------
 #* Define partes genéricas para un vehiculo (sin inicializar)
 #*----------------------------------------------------------------
+#* Usan __slots__ para que cada parte ocupe lo mínimo en flotas grandes
+#*----------------------------------------------------------------
 class Body:
-   material = None
+   __slots__ = ("material",)
+
+   def __init__(self, material=None):
+      self.material = material
+
+   def copiar(self):
+      return Body(self.material)
    
 class Turbina:
-   potencia = None
+   __slots__ = ("potencia",)
+
+   def __init__(self, potencia=None):
+      self.potencia = potencia
+
+   def copiar(self):
+      return Turbina(self.potencia)
 
 class Ala:
-   size = None
+   __slots__ = ("size",)
+
+   def __init__(self, size=None):
+      self.size = size
+
+   def copiar(self):
+      return Ala(self.size)
 
 class Tren:
-   resistencia = None
+   __slots__ = ("resistencia",)
+
+   def __init__(self, resistencia=None):
+      self.resistencia = resistencia
+
+   def copiar(self):
+      return Tren(self.resistencia)
+
+#*----------------------------------------------------------------
+#* Flota almacenada como estructura de arreglos: una columna tipada
+#* por atributo en lugar de un objeto Avion por avión. Cada avión
+#* ocupa una fila en material y resistencias y dos filas en
+#* potencias y sizes (una por turbina y una por ala), lo que permite
+#* consultas sobre toda la flota con un solo recorrido
+#*----------------------------------------------------------------
+class FlotaColumnar:
+   def __init__(self):
+      self.materiales = []                   # Materiales distintos
+      self.material = array.array("I")       # Índice en materiales
+      self.potencias = array.array("d")      # 2 por avión
+      self.sizes = array.array("d")          # 2 por avión
+      self.resistencias = array.array("d")   # 1 por avión
+
+   def __len__(self):
+      return len(self.resistencias)
+
+   def attachAvion(self, avion):
+      self.attachAviones(avion, 1)
+
+   # Agrega `cantidad` copias de un avión completo. Las columnas suponen
+   # 2 turbinas y 2 alas por avión, así que uno incompleto se rechaza; los
+   # valores se convierten antes de agregar nada para que las columnas
+   # sigan alineadas si alguno no es válido
+   def attachAviones(self, avion, cantidad):
+      if not avion.esCompleto():
+         raise ValueError("Solo se pueden agregar aviones completos a la flota")
+      potencias = array.array("d", [t.potencia for t in avion.getTurbinas()] * cantidad)
+      sizes = array.array("d", [a.size for a in avion.getAlas()] * cantidad)
+      resistencias = array.array("d", itertools.repeat(avion.getTren().resistencia, cantidad))
+      material = avion.getBody().material
+      if material not in self.materiales:
+         self.materiales.append(material)
+      self.material.extend(itertools.repeat(self.materiales.index(material), cantidad))
+      self.potencias.extend(potencias)
+      self.sizes.extend(sizes)
+      self.resistencias.extend(resistencias)
+
+   # Reconstruye el avión de la fila i
+   def getAvion(self, i):
+      return Avion.desdePartes(Body(self.materiales[self.material[i]]),
+                               [Turbina(p) for p in self.potencias[2 * i:2 * i + 2]],
+                               [Ala(s) for s in self.sizes[2 * i:2 * i + 2]],
+                               Tren(self.resistencias[i]))
+
+   def empujeTotal(self):
+      return sum(self.potencias)
+
+   def resistenciaMinima(self):
+      return min(self.resistencias)
+
+   def sizeMaximo(self):
+      return max(self.sizes)
+
+   # Cantidad de aviones por material
+   def contarPorMaterial(self):
+      cuenta = collections.Counter(self.material)
+      return {self.materiales[i]: n for i, n in cuenta.items()}
+
+#*----------------------------------------------------------------
+#* Internado de partes: partes de la misma clase y con los mismos
+#* valores se reemplazan, dentro de una tabla, por una única copia
+#* inmutable y compartida. Las copias son de una subclase "fija" de
+#* la parte que rechaza cualquier asignación; copiar() devuelve una
+#* parte común y modificable
+#*----------------------------------------------------------------
+class _ParteFija:
+   __slots__ = ()
+
+   def __setattr__(self, nombre, valor):
+      raise AttributeError("Las partes compartidas de una flota no se pueden modificar")
+
+   def __delattr__(self, nombre):
+      raise AttributeError("Las partes compartidas de una flota no se pueden modificar")
+
+   # Al ser inmutable, copiarla es devolver la misma parte; al serializarla
+   # se reconstruye a partir de la clase original y sus valores
+   def __copy__(self):
+      return self
+
+   def __deepcopy__(self, memo):
+      return self
+
+   def __reduce__(self):
+      clase = type(self).__bases__[1]
+      return _parteFija, (clase, _valoresParte(self, _camposParte(clase)))
+
+_SIN_VALOR = object()
+_clases_fijas = {}
+
+def _camposParte(clase):
+   # Los slots de toda la jerarquía, no solo los de la clase concreta
+   campos = []
+   for base in reversed(clase.__mro__):
+      slots = base.__dict__.get("__slots__", ())
+      if isinstance(slots, str):
+         slots = (slots,)
+      campos.extend(campo for campo in slots
+                    if campo not in ("__weakref__", "__dict__") and campo not in campos)
+   return tuple(campos)
+
+def _valoresParte(parte, campos):
+   return tuple(getattr(parte, campo, _SIN_VALOR) for campo in campos)
+
+def _claseFija(clase):
+   fija = _clases_fijas.get(clase)
+   if fija is None:
+      fija = (type(clase.__name__ + "Fija", (_ParteFija, clase), {"__slots__": ()}),
+              _camposParte(clase))
+      _clases_fijas[clase] = fija
+   return fija
+
+def _parteFija(clase, valores):
+   fija, campos = _claseFija(clase)
+   parte = object.__new__(fija)
+   for campo, valor in zip(campos, valores):
+      if valor is not _SIN_VALOR:
+         object.__setattr__(parte, campo, valor)
+   return parte
+
+def internarParte(parte, tabla):
+   clase = type(parte)
+   valores = _valoresParte(parte, _claseFija(clase)[1])
+   clave = (clase, valores)
+   fija = tabla.get(clave)
+   if fija is None:
+      fija = _parteFija(clase, valores)
+      tabla[clave] = fija
+   return fija
 
 #*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=
 #* Esta es la estructura main()
@@ -155,7 +478,9 @@ def main():
 #* Se detecta el entry point y se lo deriva a una sección main() propia
 #*----------------------------------------------------------------------
 if __name__ == "__main__":
-   os.system("clear")
+   # Limpia la terminal con una secuencia ANSI en lugar de lanzar "clear"
+   if sys.stdout.isatty():
+      print("\033[2J\033[H", end="")
    print("Ejemplo de un patrón de tipo builder aplicado a la construcción de un avion\n")
 
    main()
@@ -3,10 +3,17 @@
 #* Ejemplo para creación de prototipos
 #*-------------------------------------------------------------------------
 from abc import ABC, abstractmethod
+import array
 import time
 from datetime import datetime
 import copy
+import itertools
 import os
+import queue
+import threading
+import weakref
+
+from salida import obtener_salida
 
 #*-------------------------------------------------------------------------
 #* La clase prototipo utilizada como ejemplo puede estar en una librería
@@ -36,6 +43,23 @@ class Prototype(ABC):
     def clone(self):
         pass 
 
+#*------------------------------------------------------------------------------
+#* Clonado rápido: en lugar de recorrer el objeto con copy.deepcopy (y su
+#* diccionario memo) se copia el __dict__ de una vez, sin llamar a __init__.
+#* Los atributos son escalares y cadenas inmutables, así que pueden
+#* compartirse; solo los campos declarados en _campos_mutables se copian en
+#* profundidad.
+#*------------------------------------------------------------------------------
+    _campos_mutables = ()
+
+    def __copy__(self):
+        clon = object.__new__(type(self))
+        estado = self.__dict__.copy()
+        for campo in self._campos_mutables:
+            estado[campo] = copy.deepcopy(estado[campo])
+        clon.__dict__ = estado
+        return clon
+
 #*------------------------------------------------------------------------------
 #* Clase productiva que puedo querer usar como plantilla
 #*------------------------------------------------------------------------------
@@ -54,63 +78,84 @@ class Shopkeeper(Prototype):
     def __str__(self):
         return f"Comerciante" # Aqui podrian ir sus estadisticas
 
+    # Plantillas de los mensajes, compartidas por todas las instancias
+    _MENSAJES = {
+        "saludo": "¡Bienvenido, valiente aventurero! ¿En qué puedo ayudarte hoy?",
+        "vender_item": "¡Aquí tienes tu {item_name}! Por solo {precio} monedas de oro.",
+        "ofrecer_busqueda": "Escucha. {descrip_busqueda}. ¿Aceptas?",
+        "negociar_precio": "¿Qué dices de {inicial_precio} monedas de oro por el {item_name}?",
+        "reabastecer_pociones": "Hemos recibido {cant} pociones de curación. ¡llévatelas!",
+        "común": "Este {item_name} es bastante común. No tiene mucho valor.",
+        "raro": "¡Un {item_name} raro! Puedo ofrecerte un buen precio por él.",
+        "legendario": "¡Increíble! Este {item_name} es legendario. ¡Espero que lo uses sabiamente!",
+        "rareza_desconocida": "No estoy seguro de qué pensar sobre este {item_name}.",
+        "dragones": "Los dragones son criaturas majestuosas y poderosas. Tienen aliento de fuego y escamas irrompibles.",
+        "esqueletos": "Los esqueletos son no muertos que vagan por las tumbas. Son vulnerables a la luz y el fuego.",
+        "monstruo_desconocido": "No tengo mucha información sobre {monstruo}. ¡Ten cuidado ahí fuera!",
+    }
+    # Salida de los mensajes; None usa la salida por defecto (la consola)
+    salida = None
+
+    def _decir(self, clave, **datos):
+        """
+        Escribe en la salida el mensaje de la plantilla `clave`.
+        """
+        mensaje = self._MENSAJES[clave]
+        if datos:
+            mensaje = mensaje.format(**datos)
+        (self.salida or obtener_salida()).escribir(mensaje)
+
     def saludo(self):
         """
         Saluda cuando entra a la tienda.
         """
-        print("¡Bienvenido, valiente aventurero! ¿En qué puedo ayudarte hoy?")
+        self._decir("saludo")
 
     def vender_item(self, item_name, precio):
         """
         Vende un artículo mágico al aventurero y actualiza el inventario.
         """
-        print(f"¡Aquí tienes tu {item_name}! Por solo {precio} monedas de oro.")
+        self._decir("vender_item", item_name=item_name, precio=precio)
 
     def ofrecer_busqueda(self, descrip_busqueda):
         """
         Ofrece una búsqueda o misión al aventurero.
         """
-        print(f"Escucha. {descrip_busqueda}. ¿Aceptas?")
+        self._decir("ofrecer_busqueda", descrip_busqueda=descrip_busqueda)
 
     def negociar_precio(self, item_name, inicial_precio):
         """
         Negocia el precio de un artículo con el aventurero.
         """
-        print(f"¿Qué dices de {inicial_precio} monedas de oro por el {item_name}?")
+        self._decir("negociar_precio", item_name=item_name, inicial_precio=inicial_precio)
 
     def reabastecer_pociones(self, cant):
         """
         Reabastece pociones mágicas en el inventario.
         """
-        print(f"Hemos recibido {cant} pociones de curación. ¡llévatelas!")
+        self._decir("reabastecer_pociones", cant=cant)
 
     def evaluar_rareza(self, item_name, nivel_rareza):
         """
         Evalúa la rareza de un objeto y proporciona información al aventurero.
         """
-        if nivel_rareza == "común":
-            print(f"Este {item_name} es bastante común. No tiene mucho valor.")
-        elif nivel_rareza == "raro":
-            print(f"¡Un {item_name} raro! Puedo ofrecerte un buen precio por él.")
-        elif nivel_rareza == "legendario":
-            print(f"¡Increíble! Este {item_name} es legendario. ¡Espero que lo uses sabiamente!")
+        if nivel_rareza in ("común", "raro", "legendario"):
+            self._decir(nivel_rareza, item_name=item_name)
         else:
-            print(f"No estoy seguro de qué pensar sobre este {item_name}.")
+            self._decir("rareza_desconocida", item_name=item_name)
             
     def info_sobre_monstruos(self, monstruo):
         """
         Proporciona información sobre un monstruo específico.
         """
-        if monstruo == "dragones":
-            print("Los dragones son criaturas majestuosas y poderosas. Tienen aliento de fuego y escamas irrompibles.")
-        elif monstruo == "esqueletos":
-            print("Los esqueletos son no muertos que vagan por las tumbas. Son vulnerables a la luz y el fuego.")
+        if monstruo in ("dragones", "esqueletos"):
+            self._decir(monstruo)
         else:
-            print(f"No tengo mucha información sobre {monstruo}. ¡Ten cuidado ahí fuera!")
+            self._decir("monstruo_desconocido", monstruo=monstruo)
 
-    # Implementa el método de clonado mediante una copia de arbol de métodos
+    # Implementa el método de clonado mediante la copia rápida de Prototype
     def clone(self):
-        return copy.deepcopy(self)
+        return self.__copy__()
 
 #*-------------------------------------------------------------------------
 #* clase 
@@ -172,7 +217,7 @@ class Warrior(Prototype):
         
     # Overwriting Cloning Method
     def clone(self):
-        return copy.deepcopy(self)
+        return self.__copy__()
     
     
 
@@ -240,63 +285,516 @@ class Mage(Prototype):
 
     # Overwriting Cloning Method
     def clone(self):
-        return copy.deepcopy(self)
+        return self.__copy__()
 
 #*--------------------------------------------------------------------------
-#* Punto de entrada de ejecución
+#* Registro de prototipos
+#* Construye cada plantilla una sola vez (pagando el init costoso) y la
+#* guarda por clase y parámetros. Los pedidos se atienden con clones
+#* tomados de un pool que se repone en segundo plano, de modo que obtener
+#* un NPC no depende del costo del constructor.
 #*--------------------------------------------------------------------------
-print("Ejemplo de taller para patrón prototipo")
+class PrototypeRegistry:
+    def __init__(self, tamano_pool=10):
+        self.tamano_pool = tamano_pool
+        self._plantillas = {}
+        self._pools = {}
+        self._locks = {}
+        # Un único hilo de reposición atiende a todas las claves. _pendientes
+        # tiene las claves ya encoladas y los Futures de precalentar() que
+        # esperan esa reposición
+        self._pendientes = {}
+        self._cola = queue.SimpleQueue()
+        self._hilo = None
+        self._cerrado = False
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cerrar()
+
+    def _lock_de(self, clave):
+        with self._lock:
+            return self._locks.setdefault(clave, threading.Lock())
+
+    def plantilla(self, clase, *args):
+        """
+        Devuelve la plantilla de `clase` con esos parámetros, creándola si hace falta.
+        """
+        clave = (clase, args)
+        plantilla = self._plantillas.get(clave)
+        if plantilla is None:
+            # Un lock por clave: dos hilos no construyen la misma plantilla,
+            # pero sí pueden construir plantillas distintas a la vez
+            with self._lock_de(clave):
+                plantilla = self._plantillas.get(clave)
+                if plantilla is None:
+                    plantilla = clase(*args)
+                    self._pools[clave] = queue.SimpleQueue()
+                    self._plantillas[clave] = plantilla
+        return plantilla
+
+    def precalentar(self, clase, *args):
+        """
+        Construye la plantilla y llena su pool en segundo plano. Devuelve un
+        Future que se completa cuando el pool está lleno, o con la excepción
+        si no se pudo construir la plantilla o un clon.
+        """
+        from concurrent.futures import Future
+
+        futuro = Future()
+        self._pedir((clase, args), futuro)
+        return futuro
+
+    def clonar(self, clase, *args):
+        """
+        Devuelve un clon listo del pool (o uno recién hecho si está vacío) y
+        pide la reposición de esa plantilla cuando el pool baja.
+        """
+        clave = (clase, args)
+        pool = self._pools.get(clave)
+        if pool is None:
+            self.plantilla(clase, *args)
+            pool = self._pools[clave]
+        try:
+            clon = pool.get_nowait()
+        except queue.Empty:
+            clon = self.plantilla(clase, *args).clone()
+        # Se repone por tandas: solo se pide cuando el pool baja de la mitad
+        if pool.qsize() < self.tamano_pool // 2 + 1 and clave not in self._pendientes:
+            self._pedir(clave)
+        return clon
+
+    def disponibles(self, clase, *args):
+        """
+        Cantidad de clones listos en el pool de esa plantilla.
+        """
+        pool = self._pools.get((clase, args))
+        return pool.qsize() if pool is not None else 0
+
+    def cerrar(self):
+        """
+        Termina las reposiciones ya pedidas y detiene el hilo de reposición.
+        Después de cerrar, clonar() sigue funcionando pero ya no repone.
+        """
+        with self._lock:
+            self._cerrado = True
+            hilo = self._hilo
+        if hilo is not None:
+            self._cola.put(None)
+            hilo.join()
+
+    def _pedir(self, clave, futuro=None):
+        with self._lock:
+            if self._cerrado:
+                if futuro is not None:
+                    futuro.set_exception(RuntimeError("El registro de prototipos está cerrado"))
+                return
+            esperando = self._pendientes.get(clave)
+            if esperando is None:
+                esperando = self._pendientes[clave] = []
+                self._cola.put(clave)
+            if futuro is not None:
+                esperando.append(futuro)
+            if self._hilo is None:
+                self._hilo = threading.Thread(target=self._reponer, daemon=True)
+                self._hilo.start()
+
+    def _reponer(self):
+        while True:
+            clave = self._cola.get()
+            if clave is None:
+                return
+            clase, args = clave
+            error = None
+            try:
+                plantilla = self.plantilla(clase, *args)
+                pool = self._pools[clave]
+                while pool.qsize() < self.tamano_pool:
+                    pool.put(plantilla.clone())
+            except Exception as excepcion:
+                error = excepcion
+            with self._lock:
+                esperando = self._pendientes.pop(clave)
+            for futuro in esperando:
+                if error is None:
+                    futuro.set_result(None)
+                else:
+                    futuro.set_exception(error)
 
 #*--------------------------------------------------------------------------
-dt = datetime.now()
-print('Creando un objeto Shopkeeper NPC: ', dt)
-shopkeeper = Shopkeeper(180, 22, 5, 8)
+#* Generación masiva de NPCs con estado compartido (copy-on-write)
+#* Se crea una subclase de la clase de la plantilla cuyos atributos de clase
+#* son los atributos de la plantilla. Los NPCs generados son instancias
+#* vacías de esa subclase: leen los valores compartidos y, cuando un método
+#* modifica un atributo (entrenar, equip_arma, incrementar_defensa, ...),
+#* Python lo guarda en la propia instancia. Cada NPC ocupa solo lo que
+#* cambió. vars(npc) muestra únicamente esos atributos propios.
+#* La subclase se reutiliza entre llamadas con la misma plantilla y, al
+#* serializarse (pickle, deepcopy), el NPC vuelve a ser de la clase base.
+#*--------------------------------------------------------------------------
+_clases_compartidas = weakref.WeakKeyDictionary()
+# Subclase compartida -> (clase base real, estado guardado a nivel de clase)
+_origenes_compartidos = weakref.WeakKeyDictionary()
+
+def _restaurar_npc(clase, estado):
+    npc = object.__new__(clase)
+    npc.__dict__.update(estado)
+    return npc
+
+def _clase_compartida(template):
+    # Una sola subclase por plantilla mientras su estado no cambie. Tiene un
+    # nombre propio y se serializa como la clase base con el estado ya
+    # combinado, así pickle no necesita encontrarla en el módulo. Si la
+    # plantilla es a su vez un NPC generado, se parte de su clase base y del
+    # estado que hereda de su subclase compartida
+    clase = type(template)
+    estado = dict(template.__dict__)
+    origen = _origenes_compartidos.get(clase)
+    if origen is not None:
+        clase, heredado = origen
+        estado = {**heredado, **estado}
+    guardada = _clases_compartidas.get(template)
+    if guardada is not None and guardada[0] == estado:
+        return guardada[1]
+
+    def __reduce__(self):
+        return _restaurar_npc, (clase, {**estado, **self.__dict__})
+
+    compartida = type(clase.__name__ + "Compartido", (clase,), {
+        **estado,
+        "__module__": clase.__module__,
+        "__qualname__": clase.__qualname__ + "Compartido",
+        "__reduce__": __reduce__,
+    })
+    _clases_compartidas[template] = (estado, compartida)
+    _origenes_compartidos[compartida] = (clase, estado)
+    return compartida
+
+def spawn_population(template, n):
+    """
+    Genera n NPCs que comparten el estado de `template` hasta que lo modifican.
+    """
+    compartida = _clase_compartida(template)
+    crear = object.__new__
+    return [crear(compartida) for _ in range(n)]
 
-dt = datetime.now()
-print('Finaliza la creación del objeto Shopkeeper NPC: ', dt)
-print('Atributos: ' + ', '.join("%s: %s" % item for item in vars(shopkeeper).items()))
+#*--------------------------------------------------------------------------
+#* Mundo de NPCs en columnas (estructura de arreglos)
+#* Cada clase de NPC guarda sus atributos en columnas tipadas, una por
+#* atributo, en lugar de un objeto por NPC. Las acciones masivas (entrenar a
+#* todos los guerreros, clasificar a todos los magos) recorren las columnas
+#* de una vez. vista() devuelve un objeto de la clase original cuyos
+#* atributos leen y escriben en las columnas, así que los métodos existentes
+#* siguen funcionando sobre un NPC puntual.
+#*--------------------------------------------------------------------------
+class MundoNPC:
+    # Atributos numéricos (enteros) de cada clase; Warrior tiene además "arma"
+    CAMPOS = {
+        "Shopkeeper": ("height", "age", "defense", "attack", "charisma"),
+        "Warrior": ("height", "age", "defense", "attack", "stamina"),
+        "Mage": ("height", "age", "defense", "attack", "mana"),
+    }
+    BASES = (Shopkeeper, Warrior, Mage)
+    _vistas = {}
 
-# Interaccion de shopkeeper
-shopkeeper.saludo()
-shopkeeper.ofrecer_busqueda("Hay un tesoro oculto en las montañas")
+    def __init__(self):
+        self._columnas = {}
+
+    @classmethod
+    def _base(cls, clase):
+        # Las subclases (NPCs de spawn_population, vistas) se guardan junto
+        # con su clase base
+        for base in clase.__mro__:
+            if base in cls.BASES:
+                return base
+        raise TypeError(f"{clase.__name__} no es una clase de NPC del mundo")
+
+    def _columnas_de(self, clase):
+        clase = self._base(clase)
+        columnas = self._columnas.get(clase)
+        if columnas is None:
+            columnas = {campo: array.array("q") for campo in self.CAMPOS[clase.__name__]}
+            if clase is Warrior:
+                columnas["arma"] = []
+            self._columnas[clase] = columnas
+        return columnas
+
+    def agregar(self, npc):
+        """
+        Copia un NPC al mundo y devuelve su vista.
+        """
+        return self.vista(type(npc), self.poblar(npc, 1).start)
+
+    def poblar(self, template, n):
+        """
+        Agrega n NPCs con los valores de `template`; devuelve sus índices.
+        """
+        columnas = self._columnas_de(type(template))
+        inicio = len(columnas["height"])
+        # Primero se arman los valores de todas las columnas; si alguno no es
+        # válido no se agrega nada y las columnas siguen alineadas
+        nuevos = {}
+        for campo, columna in columnas.items():
+            valores = itertools.repeat(getattr(template, campo), n)
+            nuevos[campo] = (array.array(columna.typecode, valores)
+                             if isinstance(columna, array.array) else list(valores))
+        for campo, columna in columnas.items():
+            columna.extend(nuevos[campo])
+        return range(inicio, inicio + n)
+
+    def cantidad(self, clase):
+        """
+        Cantidad de NPCs de esa clase en el mundo.
+        """
+        columnas = self._columnas.get(self._base(clase))
+        return len(columnas["height"]) if columnas else 0
 
+    def columna(self, clase, campo):
+        """
+        Devuelve la columna de un atributo (para consultas sobre toda la clase).
+        """
+        return self._columnas_de(clase)[campo]
+
+    def vista(self, clase, indice):
+        """
+        Devuelve el NPC `indice` de `clase` como objeto de esa clase.
+        """
+        vista = object.__new__(self._clase_vista(clase))
+        vista.__dict__["_columnas"] = self._columnas_de(clase)
+        vista.__dict__["_indice"] = indice
+        return vista
+
+    @classmethod
+    def _clase_vista(cls, clase):
+        clase = cls._base(clase)
+        vista = cls._vistas.get(clase)
+        if vista is None:
+            campos = cls.CAMPOS[clase.__name__] + (("arma",) if clase is Warrior else ())
+            propiedades = {campo: cls._propiedad(campo) for campo in campos}
+            reducir, copiar_profundo = cls._fuera_del_mundo(clase, campos)
+            vista = type(clase.__name__ + "Vista", (clase,), {
+                **propiedades,
+                "__copy__": cls._copiar_fila,
+                "clone": cls._copiar_fila,
+                "__reduce__": reducir,
+                "__deepcopy__": copiar_profundo,
+                "__module__": clase.__module__,
+                "__qualname__": clase.__qualname__ + "Vista",
+            })
+            cls._vistas[clase] = vista
+        return vista
+
+    @staticmethod
+    def _propiedad(campo):
+        def leer(self):
+            return self._columnas[campo][self._indice]
+        def escribir(self, valor):
+            self._columnas[campo][self._indice] = valor
+        return property(leer, escribir)
+
+    @staticmethod
+    def _fuera_del_mundo(clase, campos):
+        # pickle y deepcopy sacan al NPC del mundo: devuelven un objeto común
+        # de la clase base con los valores de su fila, sin copiar las columnas
+        def estado(vista):
+            return {campo: getattr(vista, campo) for campo in campos}
+
+        def __reduce__(self):
+            return _restaurar_npc, (clase, estado(self))
+
+        def __deepcopy__(self, memo):
+            return _restaurar_npc(clase, copy.deepcopy(estado(self), memo))
+
+        return __reduce__, __deepcopy__
+
+    @staticmethod
+    def _copiar_fila(vista):
+        # Clonar una vista agrega una fila nueva con los valores de la
+        # original, en lugar de compartir su fila
+        columnas = vista._columnas
+        indice = len(columnas["height"])
+        for columna in columnas.values():
+            columna.append(columna[vista._indice])
+        clon = object.__new__(type(vista))
+        clon.__dict__["_columnas"] = columnas
+        clon.__dict__["_indice"] = indice
+        return clon
+
+    def entrenar_guerreros(self):
+        """
+        Equivale a Warrior.entrenar() sobre todos los guerreros.
+        """
+        self._sumar(Warrior, "stamina", 10)
+
+    def incrementar_defensa_magos(self, cant):
+        """
+        Equivale a Mage.incrementar_defensa(cant) sobre todos los magos.
+        """
+        self._sumar(Mage, "defense", cant)
+
+    def incrementar_ataque_magos(self, cant):
+        """
+        Equivale a Mage.incrementar_ataque(cant) sobre todos los magos.
+        """
+        self._sumar(Mage, "attack", cant)
+
+    def clasificar_magos(self):
+        """
+        Equivale a Mage.verif_nivel() sobre todos los magos; devuelve la lista
+        de mensajes en el orden de los índices.
+        """
+        columnas = self._columnas_de(Mage)
+        return ["Mago de alto nivel" if edad >= 18 and defensa >= 50 else "Mago en entrenamiento"
+                for edad, defensa in zip(columnas["age"], columnas["defense"])]
+
+    def _sumar(self, clase, campo, cant):
+        # Se actualiza la columna existente, así siguen valiendo las
+        # referencias devueltas antes por columna()
+        columna = self._columnas_de(clase)[campo]
+        columna[:] = array.array("q", [valor + cant for valor in columna])
+
+#*--------------------------------------------------------------------------
+#* Servicio de construcción concurrente
+#* El init de los prototipos es costoso pero pasa el tiempo esperando
+#* (time.sleep simula E/S), así que varios objetos pueden construirse a la
+#* vez en un pool de hilos. construir() devuelve un Future; la variante
+#* construir_async() puede esperarse desde asyncio.
 #*--------------------------------------------------------------------------
-dt = datetime.now()
-print('Creando un objeto Mage NPC: ', dt)
-mage = Mage(172, 65, 8, 15)
+class ServicioConstruccion:
+    def __init__(self, trabajadores=8):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._executor = ThreadPoolExecutor(max_workers=trabajadores)
+        self._lock = threading.Lock()
+        self._duraciones = []
+        self._inicio = None
+        self._fin = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cerrar()
+
+    def construir(self, clase, *args):
+        """
+        Encola la construcción de clase(*args) y devuelve su Future.
+        """
+        with self._lock:
+            if self._inicio is None:
+                self._inicio = time.perf_counter()
+        return self._executor.submit(self._construir_medido, clase, args)
+
+    def construir_varios(self, pedidos):
+        """
+        Recibe pares (clase, args) y devuelve la lista de Futures en el mismo orden.
+        """
+        return [self.construir(clase, *args) for clase, args in pedidos]
+
+    async def construir_async(self, clase, *args):
+        """
+        Versión para asyncio: construye en el pool sin bloquear el event loop.
+        """
+        import asyncio
+
+        return await asyncio.wrap_future(self.construir(clase, *args))
+
+    def informe(self):
+        """
+        Compara el tiempo real transcurrido con lo que habría tardado la
+        construcción secuencial (la suma de los tiempos de cada objeto).
+        """
+        with self._lock:
+            secuencial = sum(self._duraciones)
+            cantidad = len(self._duraciones)
+            inicio, fin = self._inicio, self._fin
+        real = fin - inicio if cantidad else 0.0
+        return {
+            "instancias": cantidad,
+            "segundos_reales": real,
+            "segundos_secuenciales": secuencial,
+            "aceleracion": secuencial / real if real else 0.0,
+        }
 
-dt = datetime.now()
-print('Finaliza la creación del objeto Mage NPC: ', dt)
-print('Atributos: ' + ', '.join("%s: %s" % item for item in vars(mage).items()))
+    def cerrar(self):
+        """
+        Espera las construcciones pendientes y libera el pool.
+        """
+        self._executor.shutdown(wait=True)
 
+    def _construir_medido(self, clase, args):
+        inicio = time.perf_counter()
+        objeto = clase(*args)
+        fin = time.perf_counter()
+        with self._lock:
+            self._duraciones.append(fin - inicio)
+            self._fin = fin if self._fin is None else max(self._fin, fin)
+        return objeto
+
+#*--------------------------------------------------------------------------
+#* Punto de entrada de ejecución
+#* El ejemplo solo corre al ejecutar el archivo; importarlo no tiene costo
 #*--------------------------------------------------------------------------
-dt = datetime.now()
-print('Creando un objeto Warrior NPC: ', dt)
-warrior = Warrior(185, 22, 4, 21)
-
-dt = datetime.now()
-print('Finaliza la creación del objeto Warrior NPC: ', dt)
-print('Atributos: ' + ', '.join("%s: %s" % item for item in vars(warrior).items()))
-
-# Interacción de los personajes
-
-print(warrior.grito_batalla())
-print(warrior.ataque_basico(mage))
-print(mage.lanzar_hechizo_curac(mage))
-print(mage.lanzar_fireball(warrior))
-
-
-# dt = datetime.now()
-# print('Puedo hacerlo masivamente con 10 NPCs: ', dt)
-# shopkeeper_template = Shopkeeper(180, 22, 5, 8)
-# warrior_template = Warrior(185, 22, 4, 21)
-# mage_template = Mage(172, 65, 8, 15)
-# for i in range(3):
-#     shopkeeper_clone = shopkeeper_template.clone()
-#     warrior_clone = warrior_template.clone()
-#     mage_clone = mage_template.clone()
-#     dt = datetime.now()
-#     print(f'Finaliza la creación de tripletes mediante clone {i} at: ', dt)
-
-# dt = datetime.now()
-# print('Finalizó la creación de la población NPC: ', dt)
+def main():
+    print("Ejemplo de taller para patrón prototipo")
+
+    #*--------------------------------------------------------------------------
+    dt = datetime.now()
+    print('Creando un objeto Shopkeeper NPC: ', dt)
+    shopkeeper = Shopkeeper(180, 22, 5, 8)
+
+    dt = datetime.now()
+    print('Finaliza la creación del objeto Shopkeeper NPC: ', dt)
+    print('Atributos: ' + ', '.join("%s: %s" % item for item in vars(shopkeeper).items()))
+
+    # Interaccion de shopkeeper
+    shopkeeper.saludo()
+    shopkeeper.ofrecer_busqueda("Hay un tesoro oculto en las montañas")
+
+    #*--------------------------------------------------------------------------
+    dt = datetime.now()
+    print('Creando un objeto Mage NPC: ', dt)
+    mage = Mage(172, 65, 8, 15)
+
+    dt = datetime.now()
+    print('Finaliza la creación del objeto Mage NPC: ', dt)
+    print('Atributos: ' + ', '.join("%s: %s" % item for item in vars(mage).items()))
+
+    #*--------------------------------------------------------------------------
+    dt = datetime.now()
+    print('Creando un objeto Warrior NPC: ', dt)
+    warrior = Warrior(185, 22, 4, 21)
+
+    dt = datetime.now()
+    print('Finaliza la creación del objeto Warrior NPC: ', dt)
+    print('Atributos: ' + ', '.join("%s: %s" % item for item in vars(warrior).items()))
+
+    # Interacción de los personajes
+
+    print(warrior.grito_batalla())
+    print(warrior.ataque_basico(mage))
+    print(mage.lanzar_hechizo_curac(mage))
+    print(mage.lanzar_fireball(warrior))
+
+
+    # dt = datetime.now()
+    # print('Puedo hacerlo masivamente con 10 NPCs: ', dt)
+    # shopkeeper_template = Shopkeeper(180, 22, 5, 8)
+    # warrior_template = Warrior(185, 22, 4, 21)
+    # mage_template = Mage(172, 65, 8, 15)
+    # for i in range(3):
+    #     shopkeeper_clone = shopkeeper_template.clone()
+    #     warrior_clone = warrior_template.clone()
+    #     mage_clone = mage_template.clone()
+    #     dt = datetime.now()
+    #     print(f'Finaliza la creación de tripletes mediante clone {i} at: ', dt)
+
+    # dt = datetime.now()
+    # print('Finalizó la creación de la población NPC: ', dt)
+
+
+if __name__ == "__main__":
+    main()
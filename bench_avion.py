@@ -0,0 +1,72 @@
+"""
+Benchmark de tiempo y memoria: Director.getAvion en bucle, getFlota y getFlotaColumnar.
+
+Uso:
+    python bench_avion.py [--aviones 1000000]
+"""
+import argparse
+import copy
+import pickle
+import time
+import tracemalloc
+
+from IS2_taller_avion import AvionBuilder, Director
+
+
+def medir(nombre, construir, cantidad):
+    """
+    Construye la flota y muestra el tiempo y la memoria que retiene.
+    """
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    flota = construir(cantidad)
+    segundos = time.perf_counter() - inicio
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<16} {segundos:8.3f} s  {cantidad / segundos:12,.0f} aviones/s  "
+          f"{memoria / 2**20:9.1f} MiB  {memoria / len(flota):6.1f} B/avión")
+
+
+def verificarFlotaInmutable():
+    """
+    Comprueba que las partes compartidas de una flota no se puedan
+    modificar, que sigan pudiendo copiarse y serializarse, y que flotas
+    de directores distintos no compartan partes.
+    """
+    director = Director()
+    director.setBuilder(AvionBuilder())
+    flota = director.getFlota(2)
+    turbina = flota[0].getTurbinas()[0]
+    try:
+        turbina.potencia = 1
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Se pudo modificar una parte compartida de la flota")
+    assert flota[1].getTurbinas()[0].potencia == turbina.potencia
+    assert copy.deepcopy(flota[0]).getTurbinas()[0] is turbina
+    assert pickle.loads(pickle.dumps(turbina)).potencia == turbina.potencia
+
+    otro = Director()
+    otro.setBuilder(AvionBuilder())
+    assert otro.getFlota(1)[0].getTurbinas()[0] is not turbina
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--aviones", type=int, default=1000000,
+                        help="Cantidad de aviones de la flota")
+    args = parser.parse_args()
+
+    verificarFlotaInmutable()
+
+    director = Director()
+    director.setBuilder(AvionBuilder())
+
+    medir("getAvion x N", lambda n: [director.getAvion() for _ in range(n)], args.aviones)
+    medir("getFlota(N)", director.getFlota, args.aviones)
+    medir("getFlotaColumnar", director.getFlotaColumnar, args.aviones)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark de clonado: Prototype.clone() frente a copy.deepcopy.
+
+Uso:
+    python bench_clone.py [--clones 100000]
+
+La construcción de las plantillas paga el init costoso simulado de cada
+clase; solo se mide el clonado.
+"""
+import argparse
+import copy
+import time
+
+from IS2_taller_prototipo import Mage, Shopkeeper, Warrior
+
+
+def clones_por_segundo(clonar, cantidad):
+    """
+    Ejecuta `clonar` la cantidad de veces indicada y devuelve clones por segundo.
+    """
+    inicio = time.perf_counter()
+    for _ in range(cantidad):
+        clonar()
+    return cantidad / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clones", type=int, default=100000)
+    args = parser.parse_args()
+
+    plantillas = (Shopkeeper(180, 22, 5, 8), Warrior(185, 22, 4, 21), Mage(172, 65, 8, 15))
+    print(f"{'clase':<12} {'deepcopy/s':>12} {'clone/s':>12} {'mejora':>7}")
+    for plantilla in plantillas:
+        profundo = clones_por_segundo(lambda: copy.deepcopy(plantilla), args.clones)
+        rapido = clones_por_segundo(plantilla.clone, args.clones)
+        print(f"{type(plantilla).__name__:<12} {profundo:12,.0f} {rapido:12,.0f} "
+              f"x{rapido / profundo:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
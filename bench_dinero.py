@@ -0,0 +1,56 @@
+"""
+Benchmark de totales masivos de IVA: float, Decimal y centavos enteros.
+
+Uso:
+    python bench_dinero.py [--filas 1000000]
+
+Además del tiempo informa la diferencia de cada total contra el resultado
+exacto en Decimal, redondeando cada línea al centavo.
+"""
+import argparse
+import random
+import time
+from decimal import ROUND_HALF_UP, Decimal
+
+from factorial import CalculadoraFactory, a_centavos, desde_centavos
+
+CENTAVO = Decimal("0.01")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filas", type=int, default=1000000,
+                        help="Cantidad de importes a totalizar")
+    args = parser.parse_args()
+
+    random.seed(0)
+    centavos = [random.randint(1, 10000000) for _ in range(args.filas)]
+    flotantes = [c / 100 for c in centavos]
+    decimales = [Decimal(c).scaleb(-2) for c in centavos]
+    iva = CalculadoraFactory().crear_calculadora("iva")
+    tasa_decimal = Decimal(str(iva.tasa))
+
+    def total_float():
+        return sum(iva.calcular_impuestos(flotantes))
+
+    def total_decimal():
+        return sum((d * tasa_decimal).quantize(CENTAVO, rounding=ROUND_HALF_UP)
+                   for d in decimales)
+
+    def total_centavos():
+        return desde_centavos(sum(iva.calcular_impuestos_centavos(centavos)))
+
+    exacto = None
+    for nombre, funcion in (("decimal", total_decimal), ("float", total_float),
+                            ("centavos", total_centavos)):
+        inicio = time.perf_counter()
+        total = funcion()
+        segundos = time.perf_counter() - inicio
+        if exacto is None:
+            exacto = total
+        diferencia = desde_centavos(a_centavos(total)) - exacto
+        print(f"{nombre:<9} {segundos:8.4f} s  total={total}  diferencia={diferencia}")
+
+
+if __name__ == "__main__":
+    main()
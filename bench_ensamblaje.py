@@ -0,0 +1,75 @@
+"""
+Benchmark de Director.getAvionesEnLinea y de BuilderPlantilla con builders
+que simulan trabajo real.
+
+Uso:
+    python bench_ensamblaje.py [--aviones 200] [--demora 0.002]
+                               [--trabajadores 1 2 4 8 16] [--procesos]
+"""
+import argparse
+import time
+
+from IS2_taller_avion import AvionBuilder, BuilderPlantilla, Director
+
+
+class AvionBuilderLento(AvionBuilder):
+   """
+   AvionBuilder que espera `demora` segundos por parte (E/S simulada).
+   """
+   demora = 0.002
+
+   def getBody(self):
+      time.sleep(self.demora)
+      return super().getBody()
+
+   def getTurbina(self):
+      time.sleep(self.demora)
+      return super().getTurbina()
+
+   def getAla(self):
+      time.sleep(self.demora)
+      return super().getAla()
+
+   def getTren(self):
+      time.sleep(self.demora)
+      return super().getTren()
+
+
+def main():
+   parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+   parser.add_argument("--aviones", type=int, default=200)
+   parser.add_argument("--demora", type=float, default=0.002,
+                       help="Segundos simulados por parte")
+   parser.add_argument("--trabajadores", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+   parser.add_argument("--procesos", action="store_true",
+                       help="Usar un pool de procesos en lugar de hilos")
+   args = parser.parse_args()
+
+   AvionBuilderLento.demora = args.demora
+   # Mezcla de builders distintos en una misma corrida
+   builders = [AvionBuilderLento() if i % 2 else AvionBuilder() for i in range(args.aviones)]
+   director = Director()
+
+   inicio = time.perf_counter()
+   for builder in builders:
+      director.setBuilder(builder)
+      director.getAvion()
+   secuencial = time.perf_counter() - inicio
+   print(f"{'secuencial':<16} {secuencial:8.3f} s")
+
+   director.setBuilder(BuilderPlantilla(AvionBuilderLento()))
+   inicio = time.perf_counter()
+   for _ in builders:
+      director.getAvion()
+   segundos = time.perf_counter() - inicio
+   print(f"{'plantilla':<16} {segundos:8.3f} s  x{secuencial / segundos:5.2f}")
+
+   for trabajadores in args.trabajadores:
+      inicio = time.perf_counter()
+      director.getAvionesEnLinea(builders, trabajadores, args.procesos)
+      segundos = time.perf_counter() - inicio
+      print(f"{trabajadores:>3} trabajadores  {segundos:8.3f} s  x{secuencial / segundos:5.2f}")
+
+
+if __name__ == "__main__":
+   main()
@@ -0,0 +1,68 @@
+"""
+Benchmark de FactorialCalculator frente a la cadena lineal y math.factorial.
+
+Uso:
+    python bench_factorial.py [--max-exp 6] [--max-lineal 100000]
+
+Permite ubicar en el hardware propio el punto de cruce que justifica el valor
+de FactorialCalculator.umbral_rapido.
+"""
+import argparse
+import math
+import time
+
+from factorial import FactorialCalculator
+
+
+def factorial_lineal(n):
+    """
+    Método original: cadena lineal n * (n-1)! sin caché.
+    """
+    resultado = 1
+    for i in range(2, n + 1):
+        resultado *= i
+    return resultado
+
+
+def factorial_calculator_frio(n):
+    """
+    FactorialCalculator con la caché vacía (peor caso).
+    """
+    calculadora = FactorialCalculator()
+    calculadora.configurar_cache(paso=calculadora.paso,
+                                 max_bytes=calculadora.max_bytes,
+                                 politica=calculadora.politica)
+    return calculadora.calcular_factorial(n)
+
+
+def medir(funcion, n):
+    """
+    Devuelve el tiempo en segundos de una llamada a funcion(n).
+    """
+    inicio = time.perf_counter()
+    funcion(n)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-exp", type=int, default=6,
+                        help="Exponente máximo de n = 10^k (por defecto 6)")
+    parser.add_argument("--max-lineal", type=int, default=100000,
+                        help="No medir la cadena lineal por encima de este n")
+    args = parser.parse_args()
+
+    print(f"{'n':>9} {'lineal':>10} {'calculator':>11} {'math':>10}")
+    for k in range(3, args.max_exp + 1):
+        for n in (10 ** k, 3 * 10 ** k):
+            if n > 10 ** args.max_exp:
+                break
+            lineal = (f"{medir(factorial_lineal, n):10.4f}"
+                      if n <= args.max_lineal else f"{'-':>10}")
+            calculator = medir(factorial_calculator_frio, n)
+            nativo = medir(math.factorial, n)
+            print(f"{n:>9} {lineal} {calculator:11.4f} {nativo:10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark de memoria: lista de Factura frente a FacturaBatch.
+
+Uso:
+    python bench_facturas.py [--filas 1000000]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from factorial import (Factura, FacturaBatch, FacturaFactoryIVAExento,
+                       FacturaFactoryIVAResponsable)
+
+
+class FacturaConDict:
+    """
+    Factura original, con __dict__ por instancia.
+    """
+    def __init__(self, importe):
+        self.importe = importe
+
+
+def medir(nombre, construir):
+    """
+    Construye la colección y muestra el tiempo y la memoria que retiene.
+    """
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    coleccion = construir()
+    segundos = time.perf_counter() - inicio
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<22} {segundos:8.3f} s  {memoria / 2**20:9.1f} MiB  "
+          f"{memoria / len(coleccion):6.1f} B/fila")
+    return coleccion
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filas", type=int, default=1000000,
+                        help="Cantidad de facturas a construir")
+    args = parser.parse_args()
+
+    random.seed(0)
+    importes = [random.uniform(1, 10000) for _ in range(args.filas)]
+    mitad = args.filas // 2
+    responsable = FacturaFactoryIVAResponsable()
+    exento = FacturaFactoryIVAExento()
+
+    def lista_con_dict():
+        return [FacturaConDict(responsable.importe_total(i)) for i in importes[:mitad]] + \
+               [FacturaConDict(i) for i in importes[mitad:]]
+
+    def lista_slots():
+        return [responsable.crear_factura(i) for i in importes[:mitad]] + \
+               [exento.crear_factura(i) for i in importes[mitad:]]
+
+    def lote():
+        facturas = FacturaBatch()
+        responsable.llenar_lote(facturas, importes[:mitad])
+        exento.llenar_lote(facturas, importes[mitad:])
+        return facturas
+
+    medir("list[Factura] (dict)", lista_con_dict)
+    medir("list[Factura] (slots)", lista_slots)
+    facturas = medir("FacturaBatch", lote)
+    assert isinstance(facturas[0], Factura)
+
+
+if __name__ == "__main__":
+    main()
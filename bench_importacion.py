@@ -0,0 +1,60 @@
+"""
+Benchmark del tiempo de importación de los módulos del taller.
+
+Uso:
+    python bench_importacion.py [--repeticiones 5] [--limite-ms 150]
+
+Cada módulo se importa en un intérprete nuevo. Termina con código 1 si algún
+módulo supera el límite (mejor tiempo de las repeticiones) o si escribe algo
+en la salida al importarse, para detectar regresiones del modo librería.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+MODULOS = ("factorial", "IS2_taller_avion", "IS2_taller_prototipo", "salida")
+
+SCRIPT = (
+    "import time; inicio = time.perf_counter(); import {modulo}; "
+    "import sys; sys.stderr.write(str(time.perf_counter() - inicio))"
+)
+
+
+def medir_importacion(modulo):
+    """
+    Importa `modulo` en un proceso nuevo; devuelve (segundos, salida estándar).
+    """
+    resultado = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(modulo=modulo)],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    return float(resultado.stderr.strip().splitlines()[-1]), resultado.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--limite-ms", type=float, default=150.0,
+                        help="Tiempo máximo de importación por módulo")
+    args = parser.parse_args()
+
+    fallas = 0
+    for modulo in MODULOS:
+        mediciones = [medir_importacion(modulo) for _ in range(args.repeticiones)]
+        mejor = min(segundos for segundos, _ in mediciones) * 1000
+        salida = mediciones[0][1]
+        estado = "ok"
+        if mejor > args.limite_ms:
+            estado = f"LENTO (límite {args.limite_ms:.0f} ms)"
+        elif salida:
+            estado = "ESCRIBE AL IMPORTARSE"
+        if estado != "ok":
+            fallas += 1
+        print(f"{modulo:<22} {mejor:8.1f} ms  {estado}")
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
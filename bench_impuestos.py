@@ -0,0 +1,91 @@
+"""
+Benchmark del despacho de CalculadoraFactory y del cálculo de impuestos por lote.
+
+Uso:
+    python bench_impuestos.py [--filas 1000000]
+"""
+import argparse
+import random
+import time
+
+from factorial import (CalculadoraContribMunicipales, CalculadoraFactory,
+                       CalculadoraIngresosBrutos, CalculadoraIVA)
+
+TIPOS = ("iva", "iibb", "contrib municipales")
+
+
+def crear_calculadora_encadenada(tipo):
+    """
+    Despacho original por cadena if/elif, con una instancia nueva por llamada.
+    """
+    if tipo == "iva":
+        return CalculadoraIVA()
+    elif tipo == "iibb":
+        return CalculadoraIngresosBrutos()
+    elif tipo == "contrib municipales":
+        return CalculadoraContribMunicipales()
+    else:
+        raise ValueError("Tipo de calculadora no válido.")
+
+
+def medir(funcion):
+    """
+    Devuelve el tiempo en segundos de una llamada a funcion().
+    """
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filas", type=int, default=1000000,
+                        help="Cantidad de importes a procesar")
+    args = parser.parse_args()
+
+    random.seed(0)
+    importes = [random.uniform(1, 10000) for _ in range(args.filas)]
+    tipos = [random.choice(TIPOS) for _ in range(args.filas)]
+    fabrica = CalculadoraFactory()
+    iva = fabrica.crear_calculadora("iva")
+
+    def bucle_un_tipo():
+        return [iva.calcular_impuesto(importe) for importe in importes]
+
+    def bucle_mixto():
+        return [fabrica.crear_calculadora(tipo).calcular_impuesto(importe)
+                for importe, tipo in zip(importes, tipos)]
+
+    def despacho_encadenado():
+        for tipo in tipos:
+            crear_calculadora_encadenada(tipo)
+
+    def despacho_registro():
+        for tipo in tipos:
+            fabrica.crear_calculadora(tipo)
+
+    cadena = fabrica.crear_cadena(*TIPOS)
+    calculadoras = [fabrica.crear_calculadora(tipo) for tipo in TIPOS]
+
+    def cadena_por_llamadas():
+        for importe in importes:
+            for calculadora in calculadoras:
+                importe = calculadora.calcular_impuesto(importe)
+
+    casos = (
+        ("despacho if/elif", despacho_encadenado),
+        ("despacho registro", despacho_registro),
+        ("iva, bucle por ítem", bucle_un_tipo),
+        ("iva, lote", lambda: iva.calcular_impuestos(importes)),
+        ("mixto, bucle por ítem", bucle_mixto),
+        ("mixto, lote", lambda: fabrica.calcular_impuestos(importes, tipos)),
+        ("cadena, por llamadas", cadena_por_llamadas),
+        ("cadena compilada, lote", lambda: cadena.calcular_lote(importes)),
+    )
+    for nombre, funcion in casos:
+        segundos = medir(funcion)
+        print(f"{nombre:<24} {segundos:8.4f} s  {args.filas / segundos:14,.0f} filas/s")
+
+
+if __name__ == "__main__":
+    main()
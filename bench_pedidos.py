@@ -0,0 +1,52 @@
+"""
+Generador de carga para DespachoPedidos con tráfico mixto.
+
+Uso:
+    python bench_pedidos.py [--pedidos 100000] [--trabajadores 4]
+                            [--capacidad 100] [--preparacion 0.0]
+"""
+import argparse
+import asyncio
+import random
+
+from factorial import (DespachoPedidos, Entrega_cliente, Entrega_delivery,
+                       Entrega_mostrador, Hamburguesa)
+
+TIPOS_HAMBURGUESA = ("con lechuga", "doble", "vegana", "completa")
+
+
+async def generar_carga(args):
+    """
+    Envía los pedidos al motor y devuelve sus estadísticas.
+    """
+    random.seed(0)
+    hamburguesas = [Hamburguesa(tipo) for tipo in TIPOS_HAMBURGUESA]
+    entregas = [Entrega_mostrador(), Entrega_cliente(), Entrega_delivery()]
+    despacho = DespachoPedidos(trabajadores=args.trabajadores, capacidad=args.capacidad,
+                               tiempo_preparacion=args.preparacion)
+    async with despacho:
+        for _ in range(args.pedidos):
+            await despacho.enviar(random.choice(hamburguesas), random.choice(entregas))
+    return despacho.estadisticas()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pedidos", type=int, default=100000)
+    parser.add_argument("--trabajadores", type=int, default=4)
+    parser.add_argument("--capacidad", type=int, default=100)
+    parser.add_argument("--preparacion", type=float, default=0.0,
+                        help="Segundos simulados de preparación por pedido")
+    args = parser.parse_args()
+
+    estadisticas = asyncio.run(generar_carga(args))
+    print(f"{'entrega':<18} {'pedidos':>8} {'pedidos/s':>11} {'media ms':>9} "
+          f"{'p95 ms':>8} {'max ms':>8}")
+    for tipo, datos in estadisticas.items():
+        print(f"{tipo:<18} {datos['pedidos']:>8} {datos['pedidos_por_segundo']:>11,.0f} "
+              f"{datos['latencia_media'] * 1000:>9.3f} {datos['latencia_p95'] * 1000:>8.3f} "
+              f"{datos['latencia_max'] * 1000:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark de generación masiva de NPCs: clone() uno a uno frente a
+spawn_population() con estado compartido.
+
+Uso:
+    python bench_poblacion.py [--npcs 1000000]
+
+Informa NPCs por segundo, memoria retenida por NPC y el RSS máximo del
+proceso al terminar.
+"""
+import argparse
+import resource
+import time
+import tracemalloc
+
+from IS2_taller_prototipo import Mage, Shopkeeper, Warrior, spawn_population
+
+
+def medir(nombre, generar):
+    """
+    Genera la población y muestra la velocidad y la memoria que retiene.
+    """
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    poblacion = generar()
+    segundos = time.perf_counter() - inicio
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<32} {len(poblacion) / segundos:12,.0f} NPCs/s  "
+          f"{memoria / len(poblacion):7.1f} B/NPC")
+    return poblacion
+
+
+def modificar(poblacion, cada):
+    """
+    Modifica un NPC de cada `cada`: solo esos pagan su propio estado.
+    """
+    for npc in poblacion[::cada]:
+        npc.defense += 1
+    return poblacion
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--npcs", type=int, default=1000000)
+    args = parser.parse_args()
+
+    plantillas = (Shopkeeper(180, 22, 5, 8), Warrior(185, 22, 4, 21), Mage(172, 65, 8, 15))
+    for plantilla in plantillas:
+        nombre = type(plantilla).__name__
+        medir(f"{nombre} clone()", lambda: [plantilla.clone() for _ in range(args.npcs)])
+        medir(f"{nombre} spawn_population", lambda: spawn_population(plantilla, args.npcs))
+        medir(f"{nombre} spawn + 10% modificado", lambda: modificar(
+            spawn_population(plantilla, args.npcs), 10))
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"RSS máximo: {rss / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
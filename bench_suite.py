@@ -0,0 +1,189 @@
+"""
+Suite de benchmarks de los caminos críticos del taller, con línea base.
+
+Uso:
+    python bench_suite.py                              # mide y compara con la línea base
+    python bench_suite.py --salida resultados.json     # guarda los resultados en JSON
+    python bench_suite.py --guardar-baseline           # reemplaza la línea base
+    python bench_suite.py --tolerancia 0.25 --solo factorial
+
+Cada métrica se expresa en operaciones por segundo (mayor es mejor) y se toma
+el mejor de varias repeticiones. Termina con código 1 si alguna métrica cae
+por debajo de la línea base en más de la tolerancia indicada.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+
+from factorial import (CalculadoraFactory, FactorialCalculator, FacturaFactoryIVAExento,
+                       FacturaFactoryIVANoInscripto, FacturaFactoryIVAResponsable)
+from IS2_taller_avion import AvionBuilder, Director
+from IS2_taller_prototipo import Mage, ServicioConstruccion, Shopkeeper, Warrior
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+
+def operaciones_por_segundo(funcion, repeticiones=5, operaciones=1):
+    """
+    Mejor tasa de `funcion` en varias repeticiones (como timeit.autorange).
+
+    `operaciones` indica cuántas operaciones hace cada llamada a `funcion`.
+    """
+    temporizador = timeit.Timer(funcion)
+    llamadas, _ = temporizador.autorange()
+    mejor = min(temporizador.repeat(repeat=repeticiones, number=llamadas))
+    return llamadas * operaciones / mejor
+
+
+def benchmarks_factorial():
+    calculadora = FactorialCalculator()
+
+    def frio(n):
+        def calcular():
+            calculadora.configurar_cache()
+            calculadora.calcular_factorial(n)
+        return calcular
+
+    calculadora.configurar_cache()
+    calculadora.calcular_factorial(1000)
+    return {
+        "factorial.frio_1000": frio(1000),
+        "factorial.tibio_1000": lambda: calculadora.calcular_factorial(1000),
+        "factorial.grande_100000": frio(100000),
+    }
+
+
+def benchmarks_impuestos():
+    fabrica = CalculadoraFactory()
+    tipos = ("iva", "iibb", "contrib municipales")
+    iva = fabrica.crear_calculadora("iva")
+    importes = [float(i) for i in range(1000)]
+
+    def despacho():
+        for tipo in tipos:
+            fabrica.crear_calculadora(tipo)
+
+    def calcular():
+        for importe in importes:
+            iva.calcular_impuesto(importe)
+
+    return {
+        "impuestos.despacho": (despacho, len(tipos)),
+        "impuestos.calcular_impuesto": (calcular, len(importes)),
+    }
+
+
+def benchmarks_facturas():
+    fabricas = (FacturaFactoryIVAResponsable(), FacturaFactoryIVANoInscripto(),
+                FacturaFactoryIVAExento())
+    return {f"facturas.{type(fabrica).__name__}": (lambda f=fabrica: f.crear_factura(1000.0))
+            for fabrica in fabricas}
+
+
+def benchmarks_avion():
+    director = Director()
+    director.setBuilder(AvionBuilder())
+    return {"avion.getAvion": director.getAvion}
+
+
+def benchmarks_prototipo():
+    # Las plantillas pagan el init costoso simulado; se construyen en paralelo
+    with ServicioConstruccion() as servicio:
+        futuros = servicio.construir_varios([(Shopkeeper, (180, 22, 5, 8)),
+                                             (Warrior, (185, 22, 4, 21)),
+                                             (Mage, (172, 65, 8, 15))])
+        plantillas = [futuro.result() for futuro in futuros]
+    return {f"prototipo.clone_{type(plantilla).__name__}": plantilla.clone
+            for plantilla in plantillas}
+
+
+GRUPOS = {
+    "factorial": benchmarks_factorial,
+    "impuestos": benchmarks_impuestos,
+    "facturas": benchmarks_facturas,
+    "avion": benchmarks_avion,
+    "prototipo": benchmarks_prototipo,
+}
+
+
+def ejecutar(grupos, repeticiones):
+    """
+    Ejecuta los grupos pedidos y devuelve {métrica: operaciones por segundo}.
+    """
+    metricas = {}
+    for grupo in grupos:
+        for nombre, caso in GRUPOS[grupo]().items():
+            funcion, operaciones = caso if isinstance(caso, tuple) else (caso, 1)
+            metricas[nombre] = operaciones_por_segundo(funcion, repeticiones, operaciones)
+            print(f"{nombre:<48} {metricas[nombre]:16,.1f} ops/s", file=sys.stderr)
+    return metricas
+
+
+def comparar(metricas, linea_base, tolerancia):
+    """
+    Devuelve la lista de (métrica, actual, base) que empeoraron más que la tolerancia.
+    """
+    regresiones = []
+    for nombre, actual in metricas.items():
+        base = linea_base.get(nombre)
+        if base is not None and actual < base * (1 - tolerancia):
+            regresiones.append((nombre, actual, base))
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--solo", nargs="+", choices=sorted(GRUPOS), default=list(GRUPOS),
+                        help="Grupos de benchmarks a ejecutar")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--salida", help="Archivo JSON de resultados (por defecto, stdout)")
+    parser.add_argument("--baseline", default=BASELINE, help="Archivo JSON de línea base")
+    parser.add_argument("--guardar-baseline", action="store_true",
+                        help="Guardar los resultados como nueva línea base")
+    parser.add_argument("--tolerancia", type=float, default=0.30,
+                        help="Caída relativa admitida antes de fallar (0.30 = 30%%)")
+    args = parser.parse_args(argv)
+
+    resultados = {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "metricas": ejecutar(args.solo, args.repeticiones),
+    }
+
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(texto + "\n")
+    else:
+        print(texto)
+
+    if args.guardar_baseline:
+        base = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as archivo:
+                base = json.load(archivo)
+        base.update(resultados)
+        base["metricas"] = {**base.get("metricas", {}), **resultados["metricas"]}
+        with open(args.baseline, "w", encoding="utf-8") as archivo:
+            archivo.write(json.dumps(base, indent=2, ensure_ascii=False) + "\n")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No hay línea base; usar --guardar-baseline para crearla.", file=sys.stderr)
+        return 0
+    with open(args.baseline, encoding="utf-8") as archivo:
+        linea_base = json.load(archivo)["metricas"]
+    regresiones = comparar(resultados["metricas"], linea_base, args.tolerancia)
+    for nombre, actual, base in regresiones:
+        print(f"REGRESIÓN {nombre}: {actual:,.1f} ops/s (base {base:,.1f}, "
+              f"{(1 - actual / base) * 100:.0f}% peor)", file=sys.stderr)
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+Punto de entrada único para los ejemplos del taller.
+
+Uso:
+    python cli.py factorial [n]
+    python cli.py hamburguesa
+    python cli.py facturas [archivo.csv] [--centavos] [--lote N]
+    python cli.py avion
+    python cli.py prototipo
+
+Los módulos del taller pueden importarse como librería sin ejecutar nada;
+los ejemplos solo corren cuando se piden explícitamente desde aquí o al
+ejecutar cada archivo directamente.
+"""
+import sys
+
+COMANDOS = ("factorial", "hamburguesa", "facturas", "avion", "prototipo")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMANDOS:
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+    comando, argumentos = argv[0], argv[1:]
+
+    if comando == "factorial":
+        from factorial import ejemplo_factorial
+        ejemplo_factorial(*argumentos[:1])
+    elif comando == "hamburguesa":
+        from factorial import ejemplo_hamburguesa
+        ejemplo_hamburguesa()
+    elif comando == "facturas":
+        from factorial import main as facturas
+        facturas(argumentos)
+    elif comando == "avion":
+        from IS2_taller_avion import main as avion
+        avion()
+    elif comando == "prototipo":
+        from IS2_taller_prototipo import main as prototipo
+        prototipo()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
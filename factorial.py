@@ -1,7 +1,30 @@
 """
 Libreria para la utilización de clases abstractas.
 """
+# Las dependencias costosas de importar (argparse, asyncio, csv,
+# concurrent.futures) se importan dentro de las funciones que las usan, para
+# que importar este módulo como librería sea instantáneo.
 from abc import ABC, abstractmethod
+import array
+import bisect
+import collections
+from decimal import ROUND_HALF_UP, Decimal
+import itertools
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: solo se excluyen los hilos del proceso
+    fcntl = None
+
+from salida import obtener_salida
 
 class FactorialCalculator:
     """
@@ -9,36 +32,429 @@ class FactorialCalculator:
 
     Esta clase garantiza que solo se cree una instancia y mantiene un diccionario
     para almacenar los factoriales previamente calculados.
+
+    Por defecto se guardan todos los factoriales intermedios. Con
+    configurar_cache() se puede pasar a un modo acotado que solo guarda puntos
+    de control cada `paso` enteros y respeta un presupuesto de bytes.
+
+    Cuando faltan más de `umbral_rapido` multiplicaciones, el producto se
+    calcula por división binaria (árbol de productos) en lugar de la cadena
+    lineal n * (n-1)!, que es cuadrática en el costo de los enteros grandes.
+
+    La instancia es segura entre hilos: la creación del Singleton y cada acceso
+    a la caché están protegidos por un lock, pero las multiplicaciones se hacen
+    fuera de él para no serializar los cálculos.
     """
     _instance = None
+    _instance_lock = threading.Lock()
+    umbral_rapido = 2000
     def __new__(cls):
         """
         Verifica si ya se generó una instancia
         """
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.factorials = {}
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls._crear_instancia()
         return cls._instance
 
+    @classmethod
+    def _crear_instancia(cls):
+        """
+        Crea la instancia única con la caché vacía.
+        """
+        instancia = super().__new__(cls)
+        instancia.factorials = {}
+        instancia._claves = []
+        instancia.paso = 1
+        instancia.max_bytes = None
+        instancia.politica = "lru"
+        instancia._bytes = 0
+        instancia._lock = threading.Lock()
+        instancia.disco = None
+        instancia._ruta_disco = None
+        return instancia
+
+    def usar_cache_disco(self, ruta):
+        """
+        Abre una caché persistente de factoriales y la consulta en cada cálculo.
+
+        El archivo se mapea en memoria en modo lectura, así que varios procesos
+        del mismo host comparten las mismas páginas y los valores solo se leen
+        cuando se necesitan. Si el archivo no existe se trabaja sin caché en
+        disco hasta que se llame a guardar_cache_disco().
+
+        Si el archivo existe pero no es una caché válida se lanza ValueError y
+        se sigue usando la caché en disco anterior.
+        """
+        nuevo = CacheFactorialesDisco(ruta) if os.path.exists(ruta) else None
+        self._reemplazar_disco(nuevo, ruta)
+
+    def guardar_cache_disco(self, ruta=None):
+        """
+        Vuelca la caché en memoria al archivo de caché persistente.
+
+        Se conservan las entradas que ya estaban en el archivo; el archivo nuevo
+        reemplaza al anterior de forma atómica, por lo que los procesos que lo
+        tenían abierto siguen leyendo la versión previa sin errores. La lectura
+        y escritura del archivo se hacen fuera del lock, así que los demás
+        cálculos no esperan a que termine.
+        """
+        with self._lock:
+            ruta = ruta or self._ruta_disco
+            factoriales = dict(self.factorials)
+        if ruta is None:
+            raise ValueError("No se indicó la ruta de la caché en disco")
+        CacheFactorialesDisco.escribir(ruta, factoriales)
+        self._reemplazar_disco(CacheFactorialesDisco(ruta), ruta)
+
+    def _reemplazar_disco(self, nuevo, ruta):
+        """
+        Pone en uso una caché en disco ya abierta y cierra la anterior.
+        """
+        with self._lock:
+            anterior, self.disco = self.disco, nuevo
+            self._ruta_disco = ruta
+        if anterior is not None:
+            anterior.cerrar()
+
+    def configurar_cache(self, paso=1, max_bytes=None, politica="lru"):
+        """
+        Configura la caché de factoriales y la vacía.
+
+        paso: solo se guardan los factoriales de múltiplos de `paso`; los valores
+            intermedios se reconstruyen a partir del punto de control anterior.
+        max_bytes: presupuesto de memoria de la caché (None = sin límite).
+        politica: "lru" descarta el punto de control usado hace más tiempo,
+            "tamano" descarta el de mayor tamaño.
+        """
+        if paso < 1:
+            raise ValueError("El paso de la caché debe ser mayor o igual a 1")
+        if politica not in ("lru", "tamano"):
+            raise ValueError("Política de caché no válida.")
+        with self._lock:
+            self.paso = paso
+            self.max_bytes = max_bytes
+            self.politica = politica
+            self.factorials = {}
+            self._claves = []
+            self._bytes = 0
+
     def calcular_factorial(self, n):
         """
         Calcula el factorial de un número entero dado.
+
+        El cálculo es iterativo: parte del mayor factorial ya almacenado que no
+        supere a n y multiplica hacia adelante, por lo que no depende del límite
+        de recursión de Python.
         """
         if n < 0:
             raise ValueError("El factorial no está definido para números negativos")
-        if n in self.factorials:
-            return self.factorials[n]
-        if n in (0,1):
-            self.factorials[n] = 1
-            return 1
+        with self._lock:
+            if n in self.factorials:
+                return self._usar(n)
+            k, resultado = self._mayor_factorial_hasta(n)
+            paso = self.paso
+            max_bytes = self.max_bytes
+        nuevos = collections.deque()
+        if n - k > self.umbral_rapido:
+            resultado *= _producto_rango(k, n)
+            if n % paso == 0:
+                nuevos.append((n, resultado))
         else:
-            self.factorials[n] = n * self.calcular_factorial(n - 1)
+            # Con presupuesto de bytes solo se retienen los últimos puntos de
+            # control que entran en él: los anteriores serían descartados de
+            # todos modos al guardarlos, y acumularlos rompería el techo de memoria
+            pendientes = 0
+            for i in range(k + 1, n + 1):
+                resultado *= i
+                if i % paso == 0:
+                    nuevos.append((i, resultado))
+                    if max_bytes is not None:
+                        pendientes += sys.getsizeof(resultado)
+                        while pendientes > max_bytes and nuevos:
+                            pendientes -= sys.getsizeof(nuevos.popleft()[1])
+        self._guardar_varios(nuevos)
+        return resultado
+
+    def calcular_factorial_paralelo(self, n, procesos=None):
+        """
+        Calcula el factorial de n repartiendo el producto entre varios procesos.
+
+        El rango pendiente se divide en subrangos que se multiplican en un
+        ProcessPoolExecutor; los productos parciales se combinan en árbol. Solo
+        conviene para n grandes, ya que los resultados viajan entre procesos.
+        """
+        if n < 0:
+            raise ValueError("El factorial no está definido para números negativos")
+        with self._lock:
+            if n in self.factorials:
+                return self._usar(n)
+            k, resultado = self._mayor_factorial_hasta(n)
+        if n - k <= self.umbral_rapido:
+            return self.calcular_factorial(n)
+        from concurrent.futures import ProcessPoolExecutor
+
+        procesos = procesos or os.cpu_count() or 1
+        partes = min(procesos * 4, n - k)
+        cortes = [k + (n - k) * i // partes for i in range(partes + 1)]
+        with ProcessPoolExecutor(max_workers=procesos) as executor:
+            parciales = list(executor.map(_producto_rango, cortes[:-1], cortes[1:]))
+        resultado *= _producto_lista(parciales)
+        if n % self.paso == 0:
+            self._guardar_varios([(n, resultado)])
+        return resultado
+
+    def calcular_factoriales(self, numeros, modulo=None):
+        """
+        Calcula el factorial de cada número de una lista en una sola pasada.
+
+        Los números se ordenan y cada factorial se obtiene multiplicando a partir
+        del anterior. Con `modulo` se devuelve n! % modulo sin construir nunca el
+        entero completo. El resultado respeta el orden de `numeros`.
+        """
+        if modulo is not None and modulo < 1:
+            raise ValueError("El módulo debe ser un entero positivo")
+        numeros = list(numeros)
+        if any(n < 0 for n in numeros):
+            raise ValueError("El factorial no está definido para números negativos")
+        resultados = {}
+        k, acumulado = 0, 1 if modulo is None else 1 % modulo
+        for n in sorted(set(numeros)):
+            if modulo is not None:
+                for i in range(k + 1, n + 1):
+                    acumulado = acumulado * i % modulo
+            elif n - k > self.umbral_rapido:
+                acumulado *= _producto_rango(k, n)
+            else:
+                for i in range(k + 1, n + 1):
+                    acumulado *= i
+            k = n
+            resultados[n] = acumulado
+        return [resultados[n] for n in numeros]
+
+    def calcular_factorial_mod(self, n, modulo):
+        """
+        Calcula n! % modulo sin construir el factorial completo.
+        """
+        return self.calcular_factoriales([n], modulo)[0]
+
+    def log_factorial(self, numeros):
+        """
+        Calcula log(n!) mediante la función log-gamma.
+
+        Acepta un entero o cualquier iterable de enteros; en el segundo caso
+        devuelve una lista con log(n!) para cada elemento.
+        """
+        if isinstance(numeros, int):
+            if numeros < 0:
+                raise ValueError("El factorial no está definido para números negativos")
+            return math.lgamma(numeros + 1)
+        return [self.log_factorial(n) for n in numeros]
+
+    def _mayor_factorial_hasta(self, n):
+        """
+        Devuelve el par (k, k!) con el mayor k <= n presente en la caché en
+        memoria o, si está abierta, en la caché en disco.
+        """
+        posicion = bisect.bisect_right(self._claves, n)
+        k = self._claves[posicion - 1] if posicion else None
+        if self.disco is not None:
+            k_disco = self.disco.mayor_hasta(n)
+            if k_disco is not None and (k is None or k_disco > k):
+                return k_disco, self.disco.obtener(k_disco)
+        if k is not None:
+            return k, self._usar(k)
+        self._guardar(0, 1)
+        return 0, 1
+
+    def _guardar_varios(self, nuevos):
+        """
+        Guarda bajo el lock los pares (n, n!) que otro hilo no haya guardado ya.
+        """
+        with self._lock:
+            for n, valor in nuevos:
+                if n not in self.factorials:
+                    self._guardar(n, valor)
+
+    def _usar(self, n):
+        """
+        Devuelve n! de la caché marcándolo como usado recientemente.
+        """
+        if self.max_bytes is None:
             return self.factorials[n]
+        valor = self.factorials.pop(n)
+        self.factorials[n] = valor
+        return valor
+
+    def _guardar(self, n, valor):
+        """
+        Guarda n! en la caché y descarta entradas si se supera el presupuesto.
+
+        Las claves se mantienen además en la lista ordenada _claves para
+        encontrar el punto de partida de cada cálculo con una búsqueda binaria.
+        """
+        if n not in self.factorials:
+            bisect.insort(self._claves, n)
+        self.factorials[n] = valor
+        if self.max_bytes is None:
+            return
+        self._bytes += sys.getsizeof(valor)
+        while self._bytes > self.max_bytes and self.factorials:
+            if self.politica == "lru":
+                victima = next(iter(self.factorials))
+            else:
+                victima = max(self.factorials,
+                              key=lambda m: sys.getsizeof(self.factorials[m]))
+            self._bytes -= sys.getsizeof(self.factorials.pop(victima))
+            del self._claves[bisect.bisect_left(self._claves, victima)]
+
+class CacheFactorialesDisco:
+    """
+    Caché de factoriales en un archivo binario leído mediante mmap.
+
+    Formato: una cabecera (firma, versión, cantidad de entradas), un índice
+    ordenado de entradas (n, desplazamiento, longitud) y a continuación los
+    valores de n! como enteros sin signo little-endian.
+    """
+    FIRMA = b"FACT"
+    VERSION = 1
+    _lock_escritura = threading.Lock()
+    _cabecera = struct.Struct("<4sIQ")
+    _entrada = struct.Struct("<QQQ")
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        with open(ruta, "rb") as archivo:
+            if os.fstat(archivo.fileno()).st_size < self._cabecera.size:
+                raise ValueError(f"{ruta} no es una caché de factoriales válida.")
+            self._mmap = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._leer_indice()
+        except (ValueError, struct.error):
+            self._mmap.close()
+            raise ValueError(f"{ruta} no es una caché de factoriales válida.") from None
+
+    def _leer_indice(self):
+        """
+        Valida la cabecera y carga el índice; lanza ValueError si está corrupto.
+        """
+        firma, version, cantidad = self._cabecera.unpack_from(self._mmap, 0)
+        if firma != self.FIRMA or version != self.VERSION:
+            raise ValueError("Firma o versión desconocida")
+        self._indice = {}
+        inicio = self._cabecera.size
+        tamano = len(self._mmap)
+        for i in range(cantidad):
+            n, desplazamiento, longitud = self._entrada.unpack_from(
+                self._mmap, inicio + i * self._entrada.size)
+            if desplazamiento + longitud > tamano:
+                raise ValueError("Entrada fuera del archivo")
+            self._indice[n] = (desplazamiento, longitud)
+        self._claves = sorted(self._indice)
+
+    def __contains__(self, n):
+        return n in self._indice
+
+    def __len__(self):
+        return len(self._claves)
+
+    def obtener(self, n):
+        """
+        Lee n! del archivo sin copiar los bytes intermedios.
+        """
+        desplazamiento, longitud = self._indice[n]
+        with memoryview(self._mmap) as vista:
+            return int.from_bytes(vista[desplazamiento:desplazamiento + longitud], "little")
+
+    def mayor_hasta(self, n):
+        """
+        Devuelve el mayor k <= n guardado en el archivo, o None.
+        """
+        posicion = bisect.bisect_right(self._claves, n)
+        return self._claves[posicion - 1] if posicion else None
+
+    def cerrar(self):
+        """
+        Libera el mapeo en memoria del archivo.
+        """
+        self._mmap.close()
+
+    @classmethod
+    def escribir(cls, ruta, factoriales):
+        """
+        Escribe `factoriales` (n -> n!) en `ruta`, conservando lo ya guardado.
+
+        La lectura, la combinación y el reemplazo se hacen con un lock
+        exclusivo sobre `ruta + ".lock"`, así dos hilos o procesos que guardan
+        a la vez no pierden las entradas del otro.
+        """
+        with cls._lock_escritura, open(ruta + ".lock", "a") as cerrojo:
+            if fcntl is not None:
+                fcntl.flock(cerrojo.fileno(), fcntl.LOCK_EX)
+            cls._combinar_y_escribir(ruta, factoriales)
+
+    @classmethod
+    def _combinar_y_escribir(cls, ruta, factoriales):
+        valores = {}
+        if os.path.exists(ruta):
+            anterior = cls(ruta)
+            valores = {n: anterior.obtener(n) for n in anterior._claves}
+            anterior.cerrar()
+        valores.update(factoriales)
+        claves = sorted(valores)
+        datos = [valores[n].to_bytes((valores[n].bit_length() + 7) // 8, "little")
+                 for n in claves]
+        desplazamiento = cls._cabecera.size + cls._entrada.size * len(claves)
+        descriptor, temporal = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(ruta)), suffix=".tmp")
+        try:
+            with open(descriptor, "wb") as archivo:
+                archivo.write(cls._cabecera.pack(cls.FIRMA, cls.VERSION, len(claves)))
+                for n, bloque in zip(claves, datos):
+                    archivo.write(cls._entrada.pack(n, desplazamiento, len(bloque)))
+                    desplazamiento += len(bloque)
+                for bloque in datos:
+                    archivo.write(bloque)
+            # mkstemp crea el archivo solo legible por el dueño; la caché se
+            # comparte entre procesos
+            os.chmod(temporal, 0o644)
+            os.replace(temporal, ruta)
+        except BaseException:
+            os.unlink(temporal)
+            raise
+
+def _producto_rango(a, b):
+    """
+    Devuelve el producto de los enteros en (a, b] por división binaria.
+
+    Multiplicar mitades de tamaño parecido aprovecha la multiplicación
+    Karatsuba de los enteros de Python.
+    """
+    if b - a <= 16:
+        producto = 1
+        for i in range(a + 1, b + 1):
+            producto *= i
+        return producto
+    medio = (a + b) // 2
+    return _producto_rango(a, medio) * _producto_rango(medio, b)
+
+def _producto_lista(valores):
+    """
+    Multiplica una lista de enteros combinándolos de a pares en árbol.
+    """
+    if not valores:
+        return 1
+    while len(valores) > 1:
+        pares = [valores[i] * valores[i + 1] for i in range(0, len(valores) - 1, 2)]
+        if len(valores) % 2:
+            pares.append(valores[-1])
+        valores = pares
+    return valores[0]
 
 # Ejemplo de uso
-if __name__ == "__main__":
+def ejemplo_factorial(numero="5"):  # Aquí va el numero al que le calculamos el factorial
     try:
-        numero = "5" # Aquí va el numero al que le calculamos el factorial
         factorial_calculator = FactorialCalculator()
         resultado = factorial_calculator.calcular_factorial(int(numero))
         print(f"El factorial de {numero} es {resultado}")
@@ -46,6 +462,32 @@ if __name__ == "__main__":
         print("Por favor, ingresa un número entero válido.")
 
 
+# Aritmética de punto fijo en centavos enteros.
+# Las tasas se expresan escaladas por ESCALA_TASA (1.21 -> 12100) y todo
+# redondeo se hace al centavo más cercano, con los empates alejándose de cero.
+ESCALA_TASA = 10000
+
+def a_centavos(importe):
+    """
+    Convierte un importe (int, float, str o Decimal) a centavos enteros.
+    """
+    centavos = Decimal(str(importe)).scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+    return int(centavos)
+
+def desde_centavos(centavos):
+    """
+    Convierte centavos enteros a un Decimal exacto con dos decimales.
+    """
+    return Decimal(centavos).scaleb(-2)
+
+def aplicar_tasa_centavos(centavos, tasa_escalada):
+    """
+    Devuelve centavos * tasa_escalada / ESCALA_TASA redondeado al centavo.
+    """
+    producto = centavos * tasa_escalada
+    signo = -1 if producto < 0 else 1
+    return signo * ((abs(producto) + ESCALA_TASA // 2) // ESCALA_TASA)
+
 class CalculadoraFactory:
     """
     Fábrica para crear diferentes tipos de calculadoras de impuestos.
@@ -54,52 +496,233 @@ class CalculadoraFactory:
         - "iva"
         - "iibb"
         - "contrib municipales"
+
+    Las calculadoras no tienen estado, así que se registra una única instancia
+    compartida (flyweight) por tipo y se la devuelve con una búsqueda en un
+    diccionario. Se pueden agregar tipos nuevos en tiempo de ejecución con
+    registrar().
     """
+    _calculadoras = {}
+
+    @classmethod
+    def registrar(cls, tipo, clase_calculadora):
+        """
+        Registra (o reemplaza) la calculadora asociada a un tipo de impuesto.
+
+        La clase solo necesita calcular_impuesto(importe_base); heredar de
+        Calculadora agrega `tasa` y el cálculo por lote.
+        """
+        cls._calculadoras[tipo] = clase_calculadora()
+
     def crear_calculadora(self, tipo):
         """
-        Crea una instancia de la calculadora de impuestos según el tipo especificado.
+        Devuelve la calculadora de impuestos según el tipo especificado.
         """
-        if tipo == "iva":
-            return CalculadoraIVA()
-        elif tipo == "iibb":
-            return CalculadoraIngresosBrutos()
-        elif tipo == "contrib municipales":
-            return CalculadoraContribMunicipales()
-        else:
-            raise ValueError("Tipo de calculadora no válido.")
-        
-class CalculadoraIVA:
+        try:
+            return self._calculadoras[tipo]
+        except KeyError:
+            raise ValueError("Tipo de calculadora no válido.") from None
+
+    def calcular_impuestos(self, importes, tipos):
+        """
+        Aplica a cada importe base el impuesto indicado en la misma fila de `tipos`.
+
+        Las tasas se resuelven una sola vez por tipo distinto y luego se recorren
+        ambas columnas en una única pasada. Si alguna calculadora registrada no
+        declara `tasa`, se usa su calcular_impuesto() fila por fila. Si las dos
+        columnas no tienen el mismo largo se lanza ValueError.
+        """
+        importes = list(importes)
+        tipos = list(tipos)
+        if len(importes) != len(tipos):
+            raise ValueError(f"Hay {len(importes)} importes y {len(tipos)} tipos de impuesto; "
+                             "las columnas deben tener el mismo largo.")
+        calculadoras = {tipo: self.crear_calculadora(tipo) for tipo in set(tipos)}
+        if all(hasattr(calculadora, "tasa") for calculadora in calculadoras.values()):
+            tasas = {tipo: calculadora.tasa for tipo, calculadora in calculadoras.items()}
+            return [importe * tasas[tipo] for importe, tipo in zip(importes, tipos)]
+        return [calculadoras[tipo].calcular_impuesto(importe)
+                for importe, tipo in zip(importes, tipos)]
+
+    def crear_cadena(self, *tipos):
+        """
+        Crea una cadena de impuestos que se aplican uno sobre el resultado del otro.
+
+        Ejemplo: crear_cadena("iva", "iibb", "contrib municipales").
+
+        La cadena se compila a partir de las tasas, así que todas las
+        calculadoras deben declarar `tasa`; si alguna no lo hace se lanza
+        ValueError.
+        """
+        tasas = []
+        for tipo in tipos:
+            calculadora = self.crear_calculadora(tipo)
+            if not hasattr(calculadora, "tasa"):
+                raise ValueError(f"La calculadora de '{tipo}' no declara una tasa y no "
+                                 "puede formar parte de una cadena de impuestos.")
+            tasas.append((tipo, calculadora.tasa))
+        return CadenaImpuestos(tasas)
+
+class CadenaImpuestos:
+    """
+    Cadena de impuestos apilados compilada en coeficientes precalculados.
+
+    Cada impuesto se aplica sobre el importe que dejó el anterior, por lo que el
+    total es importe_base * t1 * t2 * ... y el monto que agrega el impuesto i es
+    importe_base * t1 * ... * t(i-1) * (ti - 1). Ambos factores se calculan una
+    sola vez al crear la cadena.
+
+    En punto flotante los coeficientes compilados redondean distinto que aplicar
+    las calculadoras una tras otra: los resultados pueden diferir en el último
+    bit (por ejemplo, el IVA de 100 sale 20.999999999999996 en lugar de 21.0).
+    Para montos exactos se usan calcular_centavos() y calcular_lote_centavos(),
+    que aplican cada tasa en secuencia sobre centavos enteros.
+    """
+    def __init__(self, tasas):
+        self.tipos = [tipo for tipo, _ in tasas]
+        self.tasas_escaladas = [round(tasa * ESCALA_TASA) for _, tasa in tasas]
+        self.factor_total = 1.0
+        self.coeficientes = []
+        for _, tasa in tasas:
+            self.coeficientes.append(self.factor_total * (tasa - 1))
+            self.factor_total *= tasa
+
+    def calcular(self, importe_base):
+        """
+        Devuelve el importe final y un diccionario tipo -> monto del impuesto.
+        """
+        desglose = {tipo: importe_base * coeficiente
+                    for tipo, coeficiente in zip(self.tipos, self.coeficientes)}
+        return importe_base * self.factor_total, desglose
+
+    def calcular_lote(self, importes):
+        """
+        Aplica la cadena a una secuencia de importes en una sola pasada.
+
+        Devuelve la lista de importes finales y un diccionario tipo -> lista de
+        montos de ese impuesto, alineada con `importes`.
+        """
+        factor_total = self.factor_total
+        totales = []
+        desglose = {tipo: [] for tipo in self.tipos}
+        columnas = [(desglose[tipo].append, coeficiente)
+                    for tipo, coeficiente in zip(self.tipos, self.coeficientes)]
+        for importe in importes:
+            totales.append(importe * factor_total)
+            for agregar, coeficiente in columnas:
+                agregar(importe * coeficiente)
+        return totales, desglose
+
+    def calcular_centavos(self, importe_centavos):
+        """
+        Como calcular(), pero exacto: recibe y devuelve centavos enteros y
+        redondea al centavo después de cada impuesto.
+        """
+        actual = importe_centavos
+        desglose = {}
+        for tipo, tasa_escalada in zip(self.tipos, self.tasas_escaladas):
+            siguiente = aplicar_tasa_centavos(actual, tasa_escalada)
+            desglose[tipo] = siguiente - actual
+            actual = siguiente
+        return actual, desglose
+
+    def calcular_lote_centavos(self, importes_centavos):
+        """
+        Versión por lote de calcular_centavos(), con el mismo formato de
+        resultado que calcular_lote().
+        """
+        totales = []
+        desglose = {tipo: [] for tipo in self.tipos}
+        for importe in importes_centavos:
+            total, montos = self.calcular_centavos(importe)
+            totales.append(total)
+            for tipo, monto in montos.items():
+                desglose[tipo].append(monto)
+        return totales, desglose
+
+class Calculadora:
+    """
+    Base común de las calculadoras de impuestos.
+
+    Cada calculadora concreta define `tasa`, el factor por el que se multiplica
+    el importe base.
+    """
+    tasa = 1.0
+
+    @property
+    def tasa_escalada(self):
+        """
+        Tasa como entero escalado por ESCALA_TASA, para el modo en centavos.
+        """
+        return round(self.tasa * ESCALA_TASA)
+
+    def calcular_impuestos(self, importes):
+        """
+        Calcula el impuesto para una secuencia completa de importes base.
+        """
+        tasa = self.tasa
+        return [importe * tasa for importe in importes]
+
+    def calcular_impuesto_centavos(self, importe_centavos):
+        """
+        Calcula el impuesto de forma exacta sobre un importe en centavos enteros.
+        """
+        return aplicar_tasa_centavos(importe_centavos, self.tasa_escalada)
+
+    def calcular_impuestos_centavos(self, importes_centavos):
+        """
+        Versión por lote de calcular_impuesto_centavos().
+        """
+        importes_centavos = list(importes_centavos)
+        tasa_escalada = self.tasa_escalada
+        mitad = ESCALA_TASA // 2
+        if all(importe >= 0 for importe in importes_centavos):
+            return [(importe * tasa_escalada + mitad) // ESCALA_TASA
+                    for importe in importes_centavos]
+        return [aplicar_tasa_centavos(importe, tasa_escalada) for importe in importes_centavos]
+
+class CalculadoraIVA(Calculadora):
     """
     Calculadora de impuesto IVA (21%).
     """
+    tasa = 1.21
+
     def calcular_impuesto(self, importe_base):
         """
         Calcula el impuesto IVA a partir del importe base.
         """
         # Al importe_base se le agrega el 21%
-        return importe_base * 1.21
+        return importe_base * self.tasa
 
-class CalculadoraIngresosBrutos:
+class CalculadoraIngresosBrutos(Calculadora):
     """
     Calculadora de impuesto Ingresos Brutos (5%).
     """
+    tasa = 1.05
+
     def calcular_impuesto(self, importe_base):
         """
         Calcula el impuesto Ingresos Brutos a partir del importe base.
         """
         # Al importe_base se le agrega el 5%
-        return importe_base * 1.05
+        return importe_base * self.tasa
 
-class CalculadoraContribMunicipales:
+class CalculadoraContribMunicipales(Calculadora):
     """
     Calculadora de impuesto Contribuciones Municipales (1,2%).
     """
+    tasa = 1.012
+
     def calcular_impuesto(self, importe_base):
         """
         Calcula el impuesto Contribuciones Municipales a partir del importe base.
         """
         # Al importe_base se le agrega el 1,2%
-        return importe_base * 1.012
+        return importe_base * self.tasa
+
+CalculadoraFactory.registrar("iva", CalculadoraIVA)
+CalculadoraFactory.registrar("iibb", CalculadoraIngresosBrutos)
+CalculadoraFactory.registrar("contrib municipales", CalculadoraContribMunicipales)
 
 # Utiliza el patrón Factory para la entrega
 class Hamburguesa:
@@ -109,12 +732,21 @@ class Hamburguesa:
     def __init__(self, tipo_hamburguesa):
         self.tipo_hamburguesa = tipo_hamburguesa
         
-    def entregar_hamburguesa(self, entrega_factory):
+    def entregar_hamburguesa(self, entrega_factory, salida=None):
         """
         Imprime la descripción de la entrega de la hamburguesa.
+
+        Con `salida` se escribe en ese destino (ver salida.py) en lugar de la
+        salida por defecto.
+        """
+        (salida or obtener_salida()).escribir(self.descripcion_entrega(entrega_factory))
+
+    def descripcion_entrega(self, entrega_factory):
+        """
+        Devuelve la descripción de la entrega de la hamburguesa.
         """
         entrega = entrega_factory.entregar()
-        print(f"Hamburguesa {self.tipo_hamburguesa}: {entrega}")
+        return f"Hamburguesa {self.tipo_hamburguesa}: {entrega}"
 
 class EntregaFactory(ABC):
     """
@@ -149,8 +781,145 @@ class Entrega_delivery(EntregaFactory):
         return "Será entregada por delivery"
 
 
+class DespachoPedidos:
+    """
+    Motor asíncrono de despacho de pedidos de hamburguesas.
+
+    Cada tipo de entrega (subclase de EntregaFactory) tiene su propia cola
+    acotada y su grupo de trabajadores, de modo que mostrador, retiro y
+    delivery se atienden en paralelo. Cuando una cola está llena, enviar()
+    espera a que se libere lugar (contrapresión).
+
+    Si un pedido falla (por ejemplo, si al_entregar lanza una excepción) el
+    trabajador lo cuenta como error y sigue atendiendo la cola; detener()
+    lanza RuntimeError al final si hubo errores.
+
+    Uso:
+        async with DespachoPedidos(trabajadores=4) as despacho:
+            await despacho.enviar(Hamburguesa("doble"), Entrega_delivery())
+        print(despacho.estadisticas())
+    """
+    def __init__(self, tipos_entrega=(Entrega_mostrador, Entrega_cliente, Entrega_delivery),
+                 trabajadores=2, capacidad=100, tiempo_preparacion=0.0, al_entregar=None):
+        self.tipos_entrega = tuple(tipos_entrega)
+        self.trabajadores = trabajadores
+        self.capacidad = capacidad
+        self.tiempo_preparacion = tiempo_preparacion
+        self.al_entregar = al_entregar
+        self._colas = {}
+        self._tareas = []
+        self._latencias = {tipo: [] for tipo in self.tipos_entrega}
+        self._errores = {tipo: [] for tipo in self.tipos_entrega}
+        self._inicio = None
+        self._fin = None
+
+    async def __aenter__(self):
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, tipo_excepcion, *exc_info):
+        # Si el bloque ya falló no se tapa esa excepción con la de detener()
+        await self.detener(relanzar=tipo_excepcion is None)
+
+    async def iniciar(self):
+        """
+        Crea las colas y lanza los trabajadores de cada tipo de entrega.
+        """
+        import asyncio
+
+        self._inicio = time.perf_counter()
+        for tipo in self.tipos_entrega:
+            self._colas[tipo] = asyncio.Queue(maxsize=self.capacidad)
+            for _ in range(self.trabajadores):
+                self._tareas.append(asyncio.create_task(self._trabajador(tipo)))
+
+    async def enviar(self, hamburguesa, entrega_factory):
+        """
+        Encola un pedido; espera si la cola de su tipo de entrega está llena.
+        """
+        try:
+            cola = self._colas[type(entrega_factory)]
+        except KeyError:
+            raise ValueError("Tipo de entrega no válido.") from None
+        await cola.put((hamburguesa, entrega_factory, time.perf_counter()))
+
+    async def detener(self, relanzar=True):
+        """
+        Espera a que se procesen los pedidos pendientes y detiene los trabajadores.
+
+        Con relanzar=True, si algún pedido falló se lanza RuntimeError
+        encadenado a la primera excepción registrada.
+        """
+        import asyncio
+
+        for cola in self._colas.values():
+            await cola.join()
+        self._fin = time.perf_counter()
+        for tarea in self._tareas:
+            tarea.cancel()
+        await asyncio.gather(*self._tareas, return_exceptions=True)
+        self._tareas = []
+        errores = [error for lista in self._errores.values() for error in lista]
+        if relanzar and errores:
+            raise RuntimeError(f"{len(errores)} pedidos fallaron al despacharse") from errores[0]
+
+    async def _trabajador(self, tipo):
+        """
+        Atiende los pedidos de la cola de un tipo de entrega.
+        """
+        import asyncio
+
+        cola = self._colas[tipo]
+        while True:
+            hamburguesa, entrega_factory, llegada = await cola.get()
+            try:
+                if self.tiempo_preparacion:
+                    await asyncio.sleep(self.tiempo_preparacion)
+                descripcion = hamburguesa.descripcion_entrega(entrega_factory)
+                if self.al_entregar is not None:
+                    self.al_entregar(descripcion)
+                self._latencias[tipo].append(time.perf_counter() - llegada)
+            except Exception as error:
+                self._errores[tipo].append(error)
+            finally:
+                cola.task_done()
+
+    def estadisticas(self):
+        """
+        Devuelve pedidos, errores, pedidos por segundo y latencias (media, p50,
+        p95 y máxima, en segundos) por tipo de entrega y en total.
+        """
+        fin = self._fin if self._fin is not None else time.perf_counter()
+        duracion = fin - self._inicio if self._inicio is not None else 0.0
+        resultado = {}
+        for tipo, latencias in self._latencias.items():
+            resultado[tipo.__name__] = _resumen_latencias(latencias, duracion)
+            resultado[tipo.__name__]["errores"] = len(self._errores[tipo])
+        todas = [l for latencias in self._latencias.values() for l in latencias]
+        resultado["total"] = _resumen_latencias(todas, duracion)
+        resultado["total"]["errores"] = sum(len(e) for e in self._errores.values())
+        return resultado
+
+def _resumen_latencias(latencias, duracion):
+    """
+    Resume una lista de latencias para DespachoPedidos.estadisticas().
+    """
+    ordenadas = sorted(latencias)
+    cantidad = len(ordenadas)
+    def percentil(p):
+        return ordenadas[min(cantidad - 1, int(p * cantidad))] if cantidad else 0.0
+    return {
+        "pedidos": cantidad,
+        "pedidos_por_segundo": cantidad / duracion if duracion else 0.0,
+        "latencia_media": sum(ordenadas) / cantidad if cantidad else 0.0,
+        "latencia_p50": percentil(0.50),
+        "latencia_p95": percentil(0.95),
+        "latencia_max": ordenadas[-1] if cantidad else 0.0,
+    }
+
+
 # Ejemplo de uso
-if __name__ == "__main__":
+def ejemplo_hamburguesa():
     # Crear una hamburguesa
     hamburguesa = Hamburguesa("con lechuga")
 
@@ -171,61 +940,316 @@ if __name__ == "__main__":
 class Factura:
     """
     Clase para representar una factura.
+
+    El importe es un float o, si la factura se creó con una fábrica en modo
+    centavos, un entero de centavos.
     """
+    __slots__ = ("importe",)
+
     def __init__(self, importe: float):
         self.importe = importe
-        
+
 
 class FacturaFactory(ABC):
     """
     Clase abstracta para la fábrica de facturas.
 
     Define el método abstracto para crear una factura.
+
+    Con centavos=True la fábrica recibe y devuelve importes en centavos enteros
+    y calcula los impuestos de forma exacta; un importe que no es int se
+    rechaza con TypeError (a_centavos() convierte los demás).
     """
+    condicion = None
+
+    def __init__(self, centavos: bool = False):
+        self.centavos = centavos
+
     @abstractmethod
     def crear_factura(self) -> Factura:
         pass
 
+    def importe_total(self, importe: float) -> float:
+        """
+        Devuelve el importe final de la factura (por defecto, sin impuestos).
+        """
+        if self.centavos:
+            self._verificar_centavos(importe)
+        return importe
+
+    @staticmethod
+    def _verificar_centavos(importe):
+        if not isinstance(importe, int):
+            raise TypeError(f"En modo centavos el importe debe ser un int, no {importe!r}; "
+                            "usar a_centavos() para convertirlo.")
+
+    def llenar_lote(self, lote: "FacturaBatch", importes) -> None:
+        """
+        Agrega al lote una factura por importe sin crear objetos Factura.
+        """
+        lote.extender(map(self.importe_total, importes), self.condicion)
+
 class FacturaFactoryIVAResponsable(FacturaFactory):
     """
     Fábrica para crear facturas con IVA Responsable (21%).
     """
+    condicion = "responsable"
+    # Alícuota del IVA escalada (2100 = 21%), tomada de CalculadoraIVA
+    tasa_iva = CalculadoraIVA().tasa_escalada - ESCALA_TASA
+
     def crear_factura(self, importe: float) -> Factura:
         """
         Crea una factura con IVA Responsable.
         """
-        # Cálculo del IVA (21%)
-        iva = importe * 0.21
-        importe_total = importe + iva
-        return Factura(importe_total)
+        return Factura(self.importe_total(importe))
+
+    def importe_total(self, importe: float) -> float:
+        """
+        Devuelve el importe con el IVA (21%) agregado.
+        """
+        # Cálculo del IVA con la misma tasa que CalculadoraIVA
+        if self.centavos:
+            self._verificar_centavos(importe)
+            iva = aplicar_tasa_centavos(importe, self.tasa_iva)
+        else:
+            iva = importe * (self.tasa_iva / ESCALA_TASA)
+        return importe + iva
 
 class FacturaFactoryIVANoInscripto(FacturaFactory):
     """
     Fábrica para crear facturas con IVA No Inscripto (sin agregar impuestos).
     """
+    condicion = "no inscripto"
+
     def crear_factura(self, importe: float) -> Factura:
         """
         Crea una factura sin agregar impuestos.
         """
         # Lógica para crear una factura con IVA No Inscripto
-        return Factura(importe)
+        return Factura(self.importe_total(importe))
 
 class FacturaFactoryIVAExento(FacturaFactory):
     """
     Fábrica para crear facturas con IVA Exento (sin agregar impuestos).
     """
+    condicion = "exento"
+
     def crear_factura(self, importe: float) -> Factura:
         """
         Crea una factura con IVA Exento (sin impuestos).
         """
         # Lógica para crear una factura con IVA Exento
-        return Factura(importe)
+        return Factura(self.importe_total(importe))
+
+class FacturaBatch:
+    """
+    Lote columnar de facturas.
+
+    Guarda los importes y la condición impositiva en dos arrays tipados en lugar
+    de un objeto Factura por fila: 'd' (float) o 'q' (centavos) para el importe
+    y un byte con el índice en CONDICIONES para la condición. Los cortes con
+    lote[a:b] no copian datos: son vistas de solo lectura sobre el lote original.
+    Mientras exista algún corte, el lote original no admite filas nuevas
+    (agregar() y extender() lanzan BufferError); hay que liberar los cortes
+    antes, por ejemplo con `del corte`.
+    """
+    CONDICIONES = ("responsable", "no inscripto", "exento")
+    _codigos = {condicion: codigo for codigo, condicion in enumerate(CONDICIONES)}
+    _MENSAJE_CORTES = ("No se pueden agregar filas mientras existan cortes de este "
+                       "FacturaBatch; liberarlos antes de agregar")
+
+    def __init__(self, centavos: bool = False, _importes=None, _condiciones=None):
+        self.centavos = centavos
+        if _importes is None:
+            _importes = array.array("q" if centavos else "d")
+            _condiciones = array.array("B")
+        self.importes = _importes
+        self.condiciones = _condiciones
+
+    def __len__(self):
+        return len(self.importes)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return FacturaBatch(self.centavos,
+                                memoryview(self.importes)[indice],
+                                memoryview(self.condiciones)[indice])
+        return Factura(self.importes[indice])
+
+    def condicion(self, indice):
+        """
+        Devuelve la condición impositiva de la fila `indice`.
+        """
+        return self.CONDICIONES[self.condiciones[indice]]
+
+    def agregar(self, importe, condicion):
+        """
+        Agrega una fila al lote.
+        """
+        self.extender((importe,), condicion)
+
+    def extender(self, importes, condicion):
+        """
+        Agrega varias filas con la misma condición impositiva.
+
+        Es atómico: si algún importe no es válido no se agrega ninguna fila y
+        las dos columnas siguen alineadas.
+        """
+        self._verificar_modificable()
+        codigo = self._codigos[condicion]
+        nuevos = array.array(self.importes.typecode, importes)
+        try:
+            self.importes.extend(nuevos)
+        except BufferError:
+            raise BufferError(self._MENSAJE_CORTES) from None
+        try:
+            self.condiciones.extend(itertools.repeat(codigo, len(nuevos)))
+        except BufferError:
+            del self.importes[len(self.importes) - len(nuevos):]
+            raise BufferError(self._MENSAJE_CORTES) from None
+
+    def total(self):
+        """
+        Suma de todos los importes del lote.
+        """
+        return sum(self.importes)
+
+    def totales_por_condicion(self):
+        """
+        Devuelve un diccionario condición -> suma de importes.
+        """
+        totales = [0] * len(self.CONDICIONES)
+        for importe, codigo in zip(self.importes, self.condiciones):
+            totales[codigo] += importe
+        return dict(zip(self.CONDICIONES, totales))
+
+    def _verificar_modificable(self):
+        """
+        Los cortes son vistas sobre otro lote y no admiten filas nuevas.
+        """
+        if isinstance(self.importes, memoryview):
+            raise TypeError("No se puede agregar filas a un corte de FacturaBatch")
+
+# Fábrica de facturas que corresponde a cada condición impositiva
+FABRICAS_FACTURA = {
+    "responsable": FacturaFactoryIVAResponsable,
+    "no inscripto": FacturaFactoryIVANoInscripto,
+    "exento": FacturaFactoryIVAExento,
+}
+
+def leer_filas(archivo):
+    """
+    Lee filas "importe,condicion" de un archivo CSV o de líneas delimitadas.
+
+    Es un generador: nunca carga el archivo completo en memoria. Se ignoran las
+    líneas vacías y una cabecera cuyo primer campo sea "importe". Una fila mal
+    formada o con una condición impositiva desconocida lanza ValueError
+    indicando su número de línea.
+    """
+    import csv
+
+    lector = csv.reader(archivo)
+    for fila in lector:
+        if not fila or fila[0].strip().lower() == "importe":
+            continue
+        if len(fila) < 2:
+            raise ValueError(f"Línea {lector.line_num}: se esperaba \"importe,condicion\"")
+        importe = fila[0].strip()
+        try:
+            valido = math.isfinite(float(importe))
+        except ValueError:
+            valido = False
+        if not valido:
+            raise ValueError(f"Línea {lector.line_num}: importe no válido: {importe!r}")
+        condicion = fila[1].strip().lower()
+        if condicion not in FABRICAS_FACTURA:
+            raise ValueError(f"Línea {lector.line_num}: condición impositiva no válida: "
+                             f"{condicion!r}")
+        yield importe, condicion
+
+def generar_facturas(filas, centavos=False):
+    """
+    Crea una Factura por cada fila (importe, condicion) usando la fábrica que
+    corresponde a la condición impositiva.
+    """
+    fabricas = {condicion: clase(centavos=centavos)
+                for condicion, clase in FABRICAS_FACTURA.items()}
+    convertir = a_centavos if centavos else float
+    for importe, condicion in filas:
+        try:
+            fabrica = fabricas[condicion]
+        except KeyError:
+            raise ValueError(f"Condición impositiva no válida: {condicion}") from None
+        yield fabrica.crear_factura(convertir(importe))
+
+def en_lotes(iterable, tamano_lote):
+    """
+    Agrupa un iterable en listas de a lo sumo `tamano_lote` elementos.
+    """
+    iterador = iter(iterable)
+    while True:
+        lote = list(itertools.islice(iterador, tamano_lote))
+        if not lote:
+            return
+        yield lote
+
+def procesar_facturas(archivo, escritor, tamano_lote=10000, centavos=False):
+    """
+    Genera las facturas de `archivo` y se las entrega a `escritor` por lotes.
+
+    `escritor` es cualquier función que reciba una lista de Factura. La memoria
+    usada depende solo de `tamano_lote`, no del tamaño del archivo. Devuelve un
+    diccionario con la cantidad de filas, los segundos y las filas por segundo.
+    """
+    inicio = time.perf_counter()
+    filas = 0
+    for lote in en_lotes(generar_facturas(leer_filas(archivo), centavos), tamano_lote):
+        escritor(lote)
+        filas += len(lote)
+    segundos = time.perf_counter() - inicio
+    return {
+        "filas": filas,
+        "segundos": segundos,
+        "filas_por_segundo": filas / segundos if segundos else 0.0,
+    }
+
+def escritor_texto(salida, centavos=False):
+    """
+    Devuelve un escritor que vuelca un importe por línea en `salida`.
+    """
+    def escribir(lote):
+        if centavos:
+            salida.writelines(f"{desde_centavos(factura.importe)}\n" for factura in lote)
+        else:
+            salida.writelines(f"{factura.importe:.2f}\n" for factura in lote)
+    return escribir
 
 # Ejemplo de uso
-def main():
-    fabrica = FacturaFactoryIVAResponsable()  # Cambiar según la condición impositiva
-    factura = fabrica.crear_factura(1000)
-    print(f"Importe total: ${factura.importe:.2f}")
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generación de facturas.")
+    parser.add_argument("archivo", nargs="?",
+                        help='CSV con filas "importe,condicion" a facturar en bloque')
+    parser.add_argument("--centavos", action="store_true",
+                        help="Calcular en centavos enteros (aritmética exacta)")
+    parser.add_argument("--lote", type=int, default=10000,
+                        help="Cantidad de facturas por lote de escritura")
+    args = parser.parse_args(argv)
+
+    if args.archivo is None:
+        fabrica = FacturaFactoryIVAResponsable()  # Cambiar según la condición impositiva
+        factura = fabrica.crear_factura(1000)
+        print(f"Importe total: ${factura.importe:.2f}")
+        return
+
+    with open(args.archivo, newline="", encoding="utf-8") as archivo:
+        estadisticas = procesar_facturas(archivo, escritor_texto(sys.stdout, args.centavos),
+                                         args.lote, args.centavos)
+    print(f"{estadisticas['filas']} facturas en {estadisticas['segundos']:.2f} s "
+          f"({estadisticas['filas_por_segundo']:,.0f} filas/s)", file=sys.stderr)
 
 if __name__ == "__main__":
+    ejemplo_factorial()
+    ejemplo_hamburguesa()
     main()
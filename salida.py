@@ -0,0 +1,119 @@
+"""
+Destinos de salida intercambiables para los mensajes de los ejemplos.
+
+En lugar de llamar a print() en cada evento, las clases escriben en un objeto
+Salida. Así se puede capturar la salida en memoria, acumularla en un archivo
+con buffer o descartarla por completo en simulaciones de alto volumen.
+"""
+from abc import ABC, abstractmethod
+import sys
+
+
+class Salida(ABC):
+    """
+    Clase abstracta para un destino de mensajes.
+
+    Las salidas se comparten entre objetos: copiar o clonar un objeto que tiene
+    una salida no la duplica.
+    """
+    @abstractmethod
+    def escribir(self, mensaje):
+        """
+        Escribe un mensaje (una línea).
+        """
+        pass
+
+    def vaciar(self):
+        """
+        Fuerza la escritura de lo que esté pendiente en el buffer.
+        """
+        pass
+
+    def cerrar(self):
+        """
+        Vacía el buffer y libera los recursos de la salida.
+        """
+        self.vaciar()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class SalidaConsola(Salida):
+    """
+    Escribe cada mensaje en la salida estándar, igual que print().
+    """
+    def escribir(self, mensaje):
+        sys.stdout.write(mensaje + "\n")
+
+
+class SalidaMemoria(Salida):
+    """
+    Guarda los mensajes en una lista, útil para capturarlos o inspeccionarlos.
+    """
+    def __init__(self):
+        self.mensajes = []
+
+    def escribir(self, mensaje):
+        self.mensajes.append(mensaje)
+
+
+class SalidaArchivo(Salida):
+    """
+    Acumula los mensajes y los escribe en un archivo de a `tamano_buffer` líneas.
+    """
+    def __init__(self, ruta, tamano_buffer=10000, encoding="utf-8"):
+        self._archivo = open(ruta, "a", encoding=encoding)
+        self.tamano_buffer = tamano_buffer
+        self._buffer = []
+
+    def escribir(self, mensaje):
+        self._buffer.append(mensaje)
+        if len(self._buffer) >= self.tamano_buffer:
+            self.vaciar()
+
+    def vaciar(self):
+        if self._buffer:
+            self._archivo.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+        self._archivo.flush()
+
+    def cerrar(self):
+        self.vaciar()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cerrar()
+
+
+class SalidaNula(Salida):
+    """
+    Descarta todos los mensajes.
+    """
+    def escribir(self, mensaje):
+        pass
+
+
+_salida_actual = SalidaConsola()
+
+
+def obtener_salida():
+    """
+    Devuelve la salida usada por defecto.
+    """
+    return _salida_actual
+
+
+def establecer_salida(salida):
+    """
+    Cambia la salida usada por defecto y devuelve la anterior.
+    """
+    global _salida_actual
+    anterior, _salida_actual = _salida_actual, salida
+    return anterior